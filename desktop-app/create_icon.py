@@ -2,35 +2,37 @@
 
 from PIL import Image, ImageDraw
 
+# Render once at this size (4x supersampled 256px) and downsample the rest
+MASTER_SIZE = 1024
+
 
 def create_icon():
     """Create an ICO file for the application."""
     # Create multiple sizes for the icon
     sizes = [16, 32, 48, 64, 128, 256]
-    images = []
-
-    for size in sizes:
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-
-        # Background circle (dark blue)
-        padding = max(1, size // 16)
-        draw.ellipse(
-            [padding, padding, size - padding, size - padding],
-            fill="#1a1a2e",
-            outline="#3b82f6",
-            width=max(1, size // 16),
-        )
-
-        # Inner status dot (green for the icon)
-        dot_size = size // 3
-        offset = (size - dot_size) // 2
-        draw.ellipse(
-            [offset, offset, offset + dot_size, offset + dot_size],
-            fill="#22c55e",
-        )
-
-        images.append(image)
+
+    size = MASTER_SIZE
+    master = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(master)
+
+    # Background circle (dark blue)
+    padding = size // 16
+    draw.ellipse(
+        [padding, padding, size - padding, size - padding],
+        fill="#1a1a2e",
+        outline="#3b82f6",
+        width=size // 16,
+    )
+
+    # Inner status dot (green for the icon)
+    dot_size = size // 3
+    offset = (size - dot_size) // 2
+    draw.ellipse(
+        [offset, offset, offset + dot_size, offset + dot_size],
+        fill="#22c55e",
+    )
+
+    images = [master.resize((s, s), Image.LANCZOS) for s in sizes]
 
     # Save as ICO (Windows icon format)
     images[0].save(
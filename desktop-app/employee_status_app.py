@@ -8,10 +8,15 @@ Connects to the dashboard-service WebSocket for live updates.
 import json
 import logging
 import os
+import queue
+import random
 import sys
 import threading
+import time
 import winreg
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from functools import cached_property
 from enum import Enum
 from pathlib import Path
 from typing import Callable, Optional
@@ -27,6 +32,21 @@ except ImportError:
     HAS_TRAY = False
     pystray = None
 
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +63,22 @@ CONFIG_FILE = Path.home() / ".jwhite_employee_status" / "config.json"
 APP_NAME = "JWhite Employee Status"
 REGISTRY_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
+# Interval (ms) at which callbacks posted from background threads run on Tk
+UI_DRAIN_MS = 33
+
+# WebSocket reconnect backoff bounds (seconds)
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# Debounce window (ms) for config writes triggered by UI changes
+CONFIG_SAVE_DELAY_MS = 500
+
+# Last parsed config, keyed by the config file's mtime
+_CFG_CACHE: dict = {"mtime": None, "value": None}
+
+# Set once the config directory is known to exist
+_config_dir_ready = False
+
 
 @dataclass
 class AppConfig:
@@ -57,21 +93,45 @@ class AppConfig:
 
     @classmethod
     def load(cls) -> "AppConfig":
-        """Load config from file."""
+        """Load config from file (cached until the file changes)."""
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE) as f:
-                    data = json.load(f)
-                    return cls(**data)
+                mtime = CONFIG_FILE.stat().st_mtime_ns
+                if _CFG_CACHE["mtime"] == mtime and _CFG_CACHE["value"] is not None:
+                    return replace(_CFG_CACHE["value"])
+
+                data = json_loads(CONFIG_FILE.read_bytes())
+                config = cls(**data)
+                _CFG_CACHE["mtime"] = mtime
+                _CFG_CACHE["value"] = replace(config)
+                return config
             except Exception as e:
                 logger.warning(f"Failed to load config: {e}")
         return cls()
 
     def save(self):
-        """Save config to file."""
-        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.__dict__, f, indent=2)
+        """Save config to file (atomically, via a temp file)."""
+        global _config_dir_ready
+        _CFG_CACHE["mtime"] = None
+        if not _config_dir_ready:
+            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _config_dir_ready = True
+        tmp = CONFIG_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(json_dumps(asdict(self)))
+        os.replace(tmp, CONFIG_FILE)
+
+    @cached_property
+    def ws_url(self) -> str:
+        """WebSocket endpoint derived from server_url (computed once)."""
+        server_url = self.server_url.rstrip("/")
+        if server_url.startswith("https://"):
+            ws_url = server_url.replace("https://", "wss://")
+        elif server_url.startswith("http://"):
+            ws_url = server_url.replace("http://", "ws://")
+        else:
+            ws_url = "wss://" + server_url
+
+        return ws_url + "/api/dashboard/employee-status/ws"
 
 
 # =============================================================================
@@ -99,13 +159,17 @@ STATUS_LABELS = {
     ClockStatus.UNKNOWN: "?",
 }
 
+# Same tables keyed by the raw wire value, so updates skip Enum coercion
+STATUS_COLORS_STR = {s.value: c for s, c in STATUS_COLORS.items()}
+STATUS_LABELS_STR = {s.value: label for s, label in STATUS_LABELS.items()}
+
 
 @dataclass
 class Employee:
     """Employee status data."""
     employee_id: str
     name: str
-    clock_status: ClockStatus
+    clock_status: str  # Raw ClockStatus value
     last_updated: str = ""
 
 
@@ -134,6 +198,7 @@ class WebSocketClient:
         self._ws = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._backoff = RECONNECT_MIN_DELAY
 
     def connect(self):
         """Start WebSocket connection in background thread."""
@@ -155,7 +220,10 @@ class WebSocketClient:
 
     def _run(self):
         """WebSocket connection loop with auto-reconnect."""
-        import websocket
+        if websocket is None:
+            logger.error("websocket-client is not installed")
+            self.on_error("websocket-client is not installed")
+            return
 
         ws_url = f"{self.url}?api_key={self.api_key}"
         logger.info(f"Connecting to WebSocket: {self.url}")
@@ -169,24 +237,31 @@ class WebSocketClient:
                     on_error=self._on_ws_error,
                     on_close=self._on_close,
                 )
-                self._ws.run_forever(ping_interval=30, ping_timeout=10)
+                # websocket-client has no permessage-deflate support, so frames
+                # stay uncompressed; advertising the extension would break decoding.
+                self._ws.run_forever(
+                    ping_interval=30, ping_timeout=10, skip_utf8_validation=True
+                )
 
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
                 self.on_error(str(e))
 
             if self._running:
-                logger.info("Reconnecting in 5 seconds...")
-                import time
-                time.sleep(5)
+                # Exponential backoff with jitter so clients don't retry in lockstep
+                delay = self._backoff * (0.5 + random.random())
+                logger.info(f"Reconnecting in {delay:.1f} seconds...")
+                time.sleep(delay)
+                self._backoff = min(RECONNECT_MAX_DELAY, self._backoff * 2)
 
     def _on_open(self, ws):
         logger.info("WebSocket connected")
+        self._backoff = RECONNECT_MIN_DELAY
         self.on_connect()
 
     def _on_message(self, ws, message):
         try:
-            data = json.loads(message)
+            data = json_loads(message)
             self.on_message(data)
         except Exception as e:
             logger.error(f"Failed to parse message: {e}")
@@ -274,6 +349,14 @@ def create_tray_icon_image(connected: bool = False) -> "Image.Image":
     return image
 
 
+# Only two tray icon variants exist, so render both once up front
+_TRAY_ICON_CACHE = (
+    {True: create_tray_icon_image(True), False: create_tray_icon_image(False)}
+    if HAS_TRAY
+    else {}
+)
+
+
 # =============================================================================
 # Main Application Window
 # =============================================================================
@@ -283,12 +366,37 @@ class EmployeeStatusApp:
 
     def __init__(self):
         self.config = AppConfig.load()
-        self.employees: dict[str, Employee] = {}
         self.ws_client: Optional[WebSocketClient] = None
         self.connected = False
         self.tray_icon: Optional[pystray.Icon] = None
         self.hidden = False
 
+        # Callbacks posted by the WebSocket/tray threads for the Tk thread
+        self._ui_q: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Pending status_update messages, drained in batches on the Tk thread.
+        # Guarded by _pending_lock: the WebSocket thread appends, Tk drains.
+        self._pending_updates: deque = deque()
+        self._flush_scheduled = False
+        # all_statuses snapshots posted but not yet applied; while any are
+        # outstanding, updates wait so a snapshot can't overwrite newer state
+        self._snapshots_pending = 0
+        self._pending_lock = threading.Lock()
+
+        # Pending debounced config save (root.after id)
+        self._save_pending: Optional[str] = None
+
+        # WebSocket message type -> handler
+        self._msg_handlers: dict[str, Callable[[dict], None]] = {
+            "all_statuses": self._handle_all_statuses,
+            "status_update": self._handle_status_update,
+            "pong": self._handle_pong,
+        }
+
+        # Auto-start registry state, probed once off the UI thread
+        self._auto_start_cached: Optional[bool] = None
+        threading.Thread(target=self._probe_auto_start, daemon=True).start()
+
         # Create main window
         self.root = tk.Tk()
         self.root.title(APP_NAME)
@@ -326,6 +434,9 @@ class EmployeeStatusApp:
         # Save window position on close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Start draining callbacks posted from background threads
+        self.root.after(UI_DRAIN_MS, self._drain_ui_queue)
+
     def _build_ui(self):
         """Build the main UI."""
         # Main frame with border
@@ -391,7 +502,7 @@ class EmployeeStatusApp:
         self.list_frame = tk.Frame(self.main_frame, bg="#1a1a2e")
         self.list_frame.pack(fill=tk.BOTH, expand=True, padx=4, pady=4)
 
-        # Employee widgets container
+        # Employee rows: employee_id -> Employee plus its widgets
         self.employee_widgets: dict[str, dict] = {}
 
         # Initial message
@@ -412,16 +523,28 @@ class EmployeeStatusApp:
 
     def _make_draggable(self):
         """Make the window draggable."""
-        self._drag_data = {"x": 0, "y": 0}
+        # Pointer offset from the window origin, and latest target position
+        self._drag_data = {"x": 0, "y": 0, "target": (0, 0)}
+        self._drag_pending = False
 
         def start_drag(event):
-            self._drag_data["x"] = event.x
-            self._drag_data["y"] = event.y
+            self._drag_data["x"] = event.x_root - self.root.winfo_x()
+            self._drag_data["y"] = event.y_root - self.root.winfo_y()
+
+        def apply_drag():
+            self._drag_pending = False
+            x, y = self._drag_data["target"]
+            self.root.wm_geometry(f"+{x}+{y}")
 
         def drag(event):
-            x = self.root.winfo_x() + (event.x - self._drag_data["x"])
-            y = self.root.winfo_y() + (event.y - self._drag_data["y"])
-            self.root.geometry(f"+{x}+{y}")
+            # Only the last position matters; move at most once per idle slice
+            self._drag_data["target"] = (
+                event.x_root - self._drag_data["x"],
+                event.y_root - self._drag_data["y"],
+            )
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.root.after_idle(apply_drag)
 
         # Bind to title bar and main frame
         for widget in [self.title_bar, self.title_label, self.main_frame]:
@@ -434,16 +557,16 @@ class EmployeeStatusApp:
             return
 
         def on_show(icon, item):
-            self.root.after(0, self._show_window)
+            self._post(self._show_window)
 
         def on_settings(icon, item):
-            self.root.after(0, self._show_settings)
+            self._post(self._show_settings)
 
         def on_reconnect(icon, item):
-            self.root.after(0, self._reconnect)
+            self._post(self._reconnect)
 
         def on_quit(icon, item):
-            self.root.after(0, self._quit)
+            self._post(self._quit)
 
         menu = pystray.Menu(
             pystray.MenuItem("Show", on_show, default=True),
@@ -455,7 +578,7 @@ class EmployeeStatusApp:
 
         self.tray_icon = pystray.Icon(
             APP_NAME,
-            create_tray_icon_image(False),
+            _TRAY_ICON_CACHE[False],
             APP_NAME,
             menu,
         )
@@ -466,7 +589,7 @@ class EmployeeStatusApp:
     def _update_tray_icon(self, connected: bool):
         """Update the tray icon to reflect connection status."""
         if self.tray_icon and HAS_TRAY:
-            self.tray_icon.icon = create_tray_icon_image(connected)
+            self.tray_icon.icon = _TRAY_ICON_CACHE[bool(connected)]
 
     def _show_context_menu(self, event):
         """Show right-click context menu."""
@@ -480,7 +603,7 @@ class EmployeeStatusApp:
         )
         menu.add_checkbutton(
             label="Start at Login",
-            variable=tk.BooleanVar(value=is_auto_start_enabled()),
+            variable=tk.BooleanVar(value=self._auto_start_cached or False),
             command=self._toggle_auto_start,
         )
         menu.add_separator()
@@ -494,12 +617,19 @@ class EmployeeStatusApp:
         """Toggle always on top setting."""
         self.config.always_on_top = not self.config.always_on_top
         self.root.attributes("-topmost", self.config.always_on_top)
-        self.config.save()
+        self._schedule_save()
 
     def _toggle_auto_start(self):
         """Toggle auto-start at login."""
-        current = is_auto_start_enabled()
+        current = self._auto_start_cached
+        if current is None:
+            current = is_auto_start_enabled()
         set_auto_start(not current)
+        self._auto_start_cached = not current
+
+    def _probe_auto_start(self):
+        """Read the auto-start registry value (runs in a worker thread)."""
+        self._auto_start_cached = is_auto_start_enabled()
 
     def _show_settings(self):
         """Show settings dialog."""
@@ -512,27 +642,28 @@ class EmployeeStatusApp:
 
         if dialog.result:
             self.config = dialog.result
-            self.config.save()
+            self._schedule_save()
             self._reconnect()
 
+    def _schedule_save(self):
+        """Save config shortly, merging rapid successive changes into one write."""
+        if self._save_pending is None:
+            self._save_pending = self.root.after(CONFIG_SAVE_DELAY_MS, self._do_save)
+
+    def _do_save(self):
+        """Write config now, cancelling any pending debounced save."""
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+            self._save_pending = None
+        self.config.save()
+
     def _connect(self):
         """Connect to WebSocket server."""
         if self.ws_client:
             self.ws_client.disconnect()
 
-        # Build WebSocket URL from server URL
-        server_url = self.config.server_url.rstrip("/")
-        if server_url.startswith("https://"):
-            ws_url = server_url.replace("https://", "wss://")
-        elif server_url.startswith("http://"):
-            ws_url = server_url.replace("http://", "ws://")
-        else:
-            ws_url = "wss://" + server_url
-
-        ws_url += "/api/dashboard/employee-status/ws"
-
         self.ws_client = WebSocketClient(
-            url=ws_url,
+            url=self.config.ws_url,
             api_key=self.config.api_key,
             on_message=self._on_ws_message,
             on_connect=self._on_ws_connect,
@@ -550,85 +681,164 @@ class EmployeeStatusApp:
     def _on_ws_connect(self):
         """Handle WebSocket connection."""
         self.connected = True
-        self.root.after(0, lambda: self._draw_status_indicator(True))
-        self.root.after(0, lambda: self._update_tray_icon(True))
+        self._post(self._draw_status_indicator, True)
+        self._post(self._update_tray_icon, True)
         logger.info("Connected to server")
 
     def _on_ws_disconnect(self):
         """Handle WebSocket disconnection."""
         self.connected = False
-        self.root.after(0, lambda: self._draw_status_indicator(False))
-        self.root.after(0, lambda: self._update_tray_icon(False))
+        self._post(self._draw_status_indicator, False)
+        self._post(self._update_tray_icon, False)
         logger.info("Disconnected from server")
 
     def _on_ws_error(self, error: str):
         """Handle WebSocket error."""
         logger.error(f"WebSocket error: {error}")
-        self.root.after(0, lambda: self.status_label.config(text=f"Error: {error[:30]}..."))
+        self._post(self._show_error, error)
 
-    def _on_ws_message(self, data: dict):
-        """Handle incoming WebSocket message."""
-        msg_type = data.get("type", "")
+    def _show_error(self, error: str):
+        """Show a WebSocket error in the status label."""
+        self.status_label.config(text=f"Error: {error[:30]}...")
 
-        if msg_type == "all_statuses":
-            # Initial status dump
-            employees = data.get("employees", [])
-            self.root.after(0, lambda: self._update_all_employees(employees))
+    def _post(self, fn: Callable, *args):
+        """Queue a callback to run on the Tk thread (safe from any thread)."""
+        self._ui_q.put((fn, args))
 
-        elif msg_type == "status_update":
-            # Single employee update
-            self.root.after(0, lambda: self._update_employee(data))
+    def _drain_ui_queue(self):
+        """Run all queued callbacks posted since the last drain."""
+        # Reschedule first so a modal dialog opened by a callback can't stall us
+        self.root.after(UI_DRAIN_MS, self._drain_ui_queue)
+        while True:
+            try:
+                fn, args = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("UI callback failed")
 
-        elif msg_type == "pong":
-            pass  # Keepalive response
+    def _on_ws_message(self, data: dict):
+        """Handle incoming WebSocket message."""
+        handler = self._msg_handlers.get(data.get("type", ""))
+        if handler:
+            handler(data)
+
+    def _handle_all_statuses(self, data: dict):
+        """Initial status dump."""
+        employees = data.get("employees", [])
+        with self._pending_lock:
+            # Updates received before the snapshot are already reflected in it
+            self._pending_updates.clear()
+            self._snapshots_pending += 1
+        self._post(self._update_all_employees, employees)
+
+    def _handle_status_update(self, data: dict):
+        """Single employee update - queue it and flush the batch on the next drain."""
+        with self._pending_lock:
+            self._pending_updates.append(data)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._post(self._flush_pending_updates)
+
+    def _handle_pong(self, data: dict):
+        """Keepalive response."""
 
     def _update_all_employees(self, employees: list):
-        """Update all employee statuses."""
+        """Apply an all_statuses snapshot, then any updates that arrived after it."""
+        try:
+            self._render_all_employees(employees)
+        finally:
+            with self._pending_lock:
+                self._snapshots_pending -= 1
+                # A newer snapshot still queued will pick these up instead
+                pending = [] if self._snapshots_pending else self._take_pending_updates()
+        self._apply_updates(pending)
+
+    def _render_all_employees(self, employees: list):
+        """Update all employee statuses, reusing rows that already exist."""
         # Hide status label
         self.status_label.pack_forget()
 
-        # Clear existing widgets
-        for widget_data in self.employee_widgets.values():
-            widget_data["frame"].destroy()
-        self.employee_widgets.clear()
-        self.employees.clear()
-
         # Sort employees by name
         employees = sorted(employees, key=lambda e: e.get("name", ""))
+        new_ids = [e.get("employee_id", "") for e in employees]
 
-        # Create widgets for each employee
+        # Destroy rows for employees no longer present
+        for employee_id in set(self.employee_widgets) - set(new_ids):
+            self.employee_widgets.pop(employee_id)["frame"].destroy()
+
+        # Refresh surviving rows, create rows for new employees
         for emp_data in employees:
             employee = Employee(
                 employee_id=emp_data.get("employee_id", ""),
                 name=emp_data.get("name", "Unknown"),
-                clock_status=ClockStatus(emp_data.get("clock_status", "unknown")),
+                clock_status=emp_data.get("clock_status", "unknown"),
                 last_updated=emp_data.get("last_updated", ""),
             )
-            self.employees[employee.employee_id] = employee
-            self._create_employee_widget(employee)
+            widgets = self.employee_widgets.get(employee.employee_id)
+            if widgets is None:
+                self._create_employee_widget(employee)
+            else:
+                widgets["employee"] = employee
+                if widgets["name_label"].cget("text") != employee.name:
+                    widgets["name_label"].config(text=employee.name)
+                self._refresh_employee_widget(widgets)
+
+        # Rows are packed in employee_widgets order; repack only if it changed
+        if list(self.employee_widgets) != new_ids:
+            for employee_id in new_ids:
+                self.employee_widgets[employee_id]["frame"].pack_forget()
+            for employee_id in new_ids:
+                self.employee_widgets[employee_id]["frame"].pack(fill=tk.X, pady=1)
+            self.employee_widgets = {
+                employee_id: self.employee_widgets[employee_id] for employee_id in new_ids
+            }
 
         # Resize window to fit content
         self.root.update_idletasks()
         self.root.geometry("")
 
+    def _take_pending_updates(self) -> list:
+        """Swap out queued updates, keeping only the latest per employee (hold _pending_lock)."""
+        pending, self._pending_updates = self._pending_updates, deque()
+        latest = {d.get("employee_id", ""): d for d in pending}
+        return list(latest.values())
+
+    def _flush_pending_updates(self):
+        """Drain queued status updates, keeping only the latest per employee."""
+        with self._pending_lock:
+            self._flush_scheduled = False
+            if self._snapshots_pending:
+                # A snapshot is queued behind us; it applies these after itself
+                return
+            pending = self._take_pending_updates()
+        self._apply_updates(pending)
+
+    def _apply_updates(self, updates: list):
+        """Apply a batch of single-employee status updates."""
+        for data in updates:
+            self._update_employee(data)
+
     def _update_employee(self, data: dict):
         """Update a single employee's status."""
         employee_id = data.get("employee_id", "")
-        if employee_id in self.employees:
-            self.employees[employee_id].clock_status = ClockStatus(
-                data.get("clock_status", "unknown")
-            )
-            self.employees[employee_id].last_updated = data.get("timestamp", "")
-            self._refresh_employee_widget(employee_id)
+        widgets = self.employee_widgets.get(employee_id)
+        if widgets is not None:
+            employee = widgets["employee"]
+            employee.clock_status = data.get("clock_status", "unknown")
+            employee.last_updated = data.get("timestamp", "")
+            self._refresh_employee_widget(widgets)
         else:
             # New employee, add them
             employee = Employee(
                 employee_id=employee_id,
                 name=data.get("name", "Unknown"),
-                clock_status=ClockStatus(data.get("clock_status", "unknown")),
+                clock_status=data.get("clock_status", "unknown"),
                 last_updated=data.get("timestamp", ""),
             )
-            self.employees[employee_id] = employee
             self._create_employee_widget(employee)
 
     def _create_employee_widget(self, employee: Employee):
@@ -640,8 +850,8 @@ class EmployeeStatusApp:
         canvas = tk.Canvas(frame, width=14, height=14, bg="#1a1a2e", highlightthickness=0)
         canvas.pack(side=tk.LEFT, padx=(4, 6))
 
-        color = STATUS_COLORS.get(employee.clock_status, "#6b7280")
-        canvas.create_oval(2, 2, 12, 12, fill=color, outline=color)
+        color = STATUS_COLORS_STR.get(employee.clock_status, "#6b7280")
+        oval_id = canvas.create_oval(2, 2, 12, 12, fill=color, outline=color)
 
         # Name label
         name_label = tk.Label(
@@ -654,10 +864,11 @@ class EmployeeStatusApp:
         )
         name_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        # Status text
+        # Status text (bound to a StringVar so refreshes only set the var)
+        text_var = tk.StringVar(value=STATUS_LABELS_STR.get(employee.clock_status, "?"))
         status_label = tk.Label(
             frame,
-            text=STATUS_LABELS.get(employee.clock_status, "?"),
+            textvariable=text_var,
             bg="#1a1a2e",
             fg=color,
             font=("Segoe UI", 8),
@@ -666,31 +877,33 @@ class EmployeeStatusApp:
         status_label.pack(side=tk.RIGHT, padx=4)
 
         self.employee_widgets[employee.employee_id] = {
+            "employee": employee,
             "frame": frame,
             "canvas": canvas,
+            "oval_id": oval_id,
             "name_label": name_label,
             "status_label": status_label,
+            "text_var": text_var,
+            "last_status": employee.clock_status,
         }
 
-    def _refresh_employee_widget(self, employee_id: str):
-        """Refresh an employee's widget with current status."""
-        if employee_id not in self.employee_widgets:
-            return
+    def _refresh_employee_widget(self, widgets: dict):
+        """Refresh an employee row's widgets with its current status."""
+        employee = widgets["employee"]
 
-        employee = self.employees[employee_id]
-        widgets = self.employee_widgets[employee_id]
+        # Heartbeat re-broadcasts often carry an unchanged status
+        if employee.clock_status == widgets["last_status"]:
+            return
 
-        color = STATUS_COLORS.get(employee.clock_status, "#6b7280")
+        color = STATUS_COLORS_STR.get(employee.clock_status, "#6b7280")
 
-        # Update circle
-        widgets["canvas"].delete("all")
-        widgets["canvas"].create_oval(2, 2, 12, 12, fill=color, outline=color)
+        # Recolor the existing circle instead of recreating it
+        widgets["canvas"].itemconfig(widgets["oval_id"], fill=color, outline=color)
 
         # Update status text
-        widgets["status_label"].config(
-            text=STATUS_LABELS.get(employee.clock_status, "?"),
-            fg=color,
-        )
+        widgets["text_var"].set(STATUS_LABELS_STR.get(employee.clock_status, "?"))
+        widgets["status_label"].config(fg=color)
+        widgets["last_status"] = employee.clock_status
 
     def _show_window(self):
         """Show the main window."""
@@ -709,11 +922,13 @@ class EmployeeStatusApp:
         # Save window position
         self.config.window_x = self.root.winfo_x()
         self.config.window_y = self.root.winfo_y()
-        self.config.save()
+        self._do_save()
         self._quit()
 
     def _quit(self):
         """Quit the application."""
+        if self._save_pending is not None:
+            self._do_save()
         if self.ws_client:
             self.ws_client.disconnect()
         if self.tray_icon:
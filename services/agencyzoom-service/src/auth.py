@@ -1,23 +1,47 @@
 """AgencyZoom authentication handling with JWT token management."""
 
+import asyncio
+import base64
+import json
 import logging
 import time
-from datetime import datetime
-from typing import Optional
-
-import httpx
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from .config import get_settings
+from .http_client import get_client
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Token cache
+# Token cache (expires_at is a time.monotonic() deadline)
 _token_cache = {
     "access_token": None,
     "expires_at": 0,
+    "headers": None,  # Read-only request headers built for access_token
 }
 
+# Serializes token refresh so concurrent callers share a single login
+_auth_lock = asyncio.Lock()
+
+# Assumed token lifetime when the JWT carries no readable exp claim
+DEFAULT_TOKEN_LIFETIME_SECONDS = 23 * 60 * 60
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the exp claim (epoch seconds) from a JWT without verifying it.
+
+    Only used to decide when to refresh our cached token locally.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp else None
+    except Exception:
+        return None
+
 
 async def get_access_token() -> str:
     """
@@ -29,57 +53,86 @@ async def get_access_token() -> str:
     Raises:
         Exception: If authentication fails
     """
-    current_time = time.time()
-
     # Check if we have a valid cached token
-    if _token_cache["access_token"] and current_time < _token_cache["expires_at"]:
+    if _token_cache["access_token"] and time.monotonic() < _token_cache["expires_at"]:
         return _token_cache["access_token"]
 
-    # Need to authenticate
-    logger.info("Authenticating with AgencyZoom API")
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{settings.agencyzoom_api_url}/v1/api/auth/login",
-            json={
-                "username": settings.agencyzoom_username,
-                "password": settings.agencyzoom_password,
-            },
-            timeout=30.0,
-        )
-
-        if response.status_code != 200:
-            logger.error(f"AgencyZoom auth failed: {response.status_code} - {response.text}")
-            raise Exception(f"AgencyZoom authentication failed: {response.status_code}")
+    async with _auth_lock:
+        # Another caller may have refreshed the token while we waited
+        if _token_cache["access_token"] and time.monotonic() < _token_cache["expires_at"]:
+            return _token_cache["access_token"]
 
-        data = response.json()
-        # AgencyZoom returns 'jwt' not 'accessToken'
-        access_token = data.get("jwt") or data.get("accessToken")
+        return await _authenticate()
 
-        if not access_token:
-            logger.error(f"No token in response: {data}")
-            raise Exception("No access token in auth response")
 
-        # Cache the token (AgencyZoom tokens typically expire in 24 hours)
-        # We'll set expiry to 23 hours to be safe
-        _token_cache["access_token"] = access_token
-        _token_cache["expires_at"] = current_time + (23 * 60 * 60)  # 23 hours
+async def _authenticate() -> str:
+    """Log in to AgencyZoom and cache the new token (caller holds _auth_lock)."""
+    # Need to authenticate
+    logger.info("Authenticating with AgencyZoom API")
 
-        logger.info("Successfully authenticated with AgencyZoom")
-        return access_token
+    client = await get_client()
+    response = await client.post(
+        "/v1/api/auth/login",
+        json={
+            "username": settings.agencyzoom_username,
+            "password": settings.agencyzoom_password,
+        },
+    )
+
+    if response.status_code != 200:
+        logger.error("AgencyZoom auth failed: %s - %s", response.status_code, response.text)
+        raise Exception(f"AgencyZoom authentication failed: {response.status_code}")
+
+    data = response.json()
+    # AgencyZoom returns 'jwt' not 'accessToken'
+    access_token = data.get("jwt") or data.get("accessToken")
+
+    if not access_token:
+        logger.error("No token in response: %s", data)
+        raise Exception("No access token in auth response")
+
+    # Cache the token until shortly before its exp claim; fall back to
+    # 23 hours (AgencyZoom tokens typically expire in 24) if it has none.
+    # exp is wall-clock, so convert it to a lifetime once and track that
+    # against the monotonic clock.
+    exp = _jwt_expiry(access_token)
+    if exp is not None:
+        lifetime = exp - time.time() - settings.token_refresh_buffer
+    else:
+        lifetime = DEFAULT_TOKEN_LIFETIME_SECONDS
+    _token_cache["access_token"] = access_token
+    _token_cache["expires_at"] = time.monotonic() + lifetime
+    _token_cache["headers"] = _build_auth_headers(access_token)
+
+    logger.info("Successfully authenticated with AgencyZoom")
+    return access_token
 
 
 def clear_token_cache():
     """Clear the token cache (useful if token becomes invalid)."""
     _token_cache["access_token"] = None
     _token_cache["expires_at"] = 0
+    _token_cache["headers"] = None
     logger.info("Token cache cleared")
 
 
-async def get_auth_headers() -> dict:
-    """Get headers with Bearer token for API requests."""
-    token = await get_access_token()
-    return {
+def _build_auth_headers(token: str) -> Mapping[str, str]:
+    """Build the read-only header mapping for a token."""
+    return MappingProxyType({
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-    }
+    })
+
+
+async def get_auth_headers() -> Mapping[str, str]:
+    """
+    Get headers with Bearer token for API requests.
+
+    The mapping is shared and read-only; copy it to add headers.
+    """
+    token = await get_access_token()
+    headers = _token_cache["headers"]
+    # Cache may have been cleared or refreshed since get_access_token returned
+    if headers is None or _token_cache["access_token"] != token:
+        headers = _build_auth_headers(token)
+    return headers
@@ -2,29 +2,101 @@
 
 import asyncio
 import logging
-import re
-from datetime import datetime
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional
 
 import httpx
+import orjson
 
-from .config import get_settings
 from .auth import get_auth_headers, clear_token_cache
+from .config import get_settings
+from .http_client import get_client
 
-logger = logging.getLogger(__name__)
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 # Rate limiting configuration
 # AgencyZoom limits: 30 calls/min during day, 60 calls/min 10PM-4AM CT
-RATE_LIMIT_RETRY_SECONDS = 65  # Wait slightly over 1 minute on rate limit
+RATE_LIMIT_RETRY_SECONDS = 65  # Fallback wait on 429 when no Retry-After header is sent
 MAX_RETRIES = 3
-# Proactive delay between requests to stay under rate limit (2 seconds = max 30/min)
-REQUEST_DELAY_SECONDS = 2.0
+# Proactive client-side limit: burst + refill over any 60s window stays <= 30 calls
+RATE_LIMIT_PER_MINUTE = 30
+RATE_LIMIT_BURST = 2  # Lets search_by_phone's customer + lead lookups go out together
+# Largest bulk note batch: about one minute of rate-limit budget per request
+MAX_BULK_NOTES = 25
+
+# str.translate table deleting every ASCII character that isn't a digit
+_STRIP_NON_DIGITS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not 48 <= c <= 57
+))
+
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter that is safe to share between coroutines."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.updated_at:
+                    # Paused after a 429 - wait out the penalty window
+                    await asyncio.sleep(self.updated_at - now)
+                    continue
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the next `seconds` (e.g. after a 429)."""
+        self.tokens = 0
+        self.updated_at = max(self.updated_at, time.monotonic() + seconds)
+
+
+# Shared by every AgencyZoom call made from this process
+_bucket = AsyncTokenBucket(
+    rate=(RATE_LIMIT_PER_MINUTE - RATE_LIMIT_BURST) / 60,
+    capacity=RATE_LIMIT_BURST,
+)
 
-# Track last request time for rate limiting
-_last_request_time: Optional[datetime] = None
+# Caps in-flight AgencyZoom requests so bursts queue here instead of thrashing the pool
+_upstream_sem = asyncio.Semaphore(settings.agencyzoom_max_concurrency)
 
 
+def pool_stats() -> dict:
+    """Current upstream concurrency usage, for the debug endpoint."""
+    limit = settings.agencyzoom_max_concurrency
+    available = _upstream_sem._value
+    return {
+        "limit": limit,
+        "in_use": limit - available,
+        "available": available,
+    }
+
+
+@lru_cache(maxsize=4096)
 def normalize_phone(phone: str) -> str:
     """
     Normalize phone number for AgencyZoom search.
@@ -40,8 +112,14 @@ def normalize_phone(phone: str) -> str:
     if not phone:
         return ""
 
-    # Strip all non-digit characters
-    digits = re.sub(r"\D", "", phone)
+    # Already normalized (e.g. search_by_phone passing its result back in)
+    if len(phone) == 10 and phone.isascii() and phone.isdigit():
+        return phone
+
+    # Strip all non-digit characters (non-ASCII input is rare, drop it up front)
+    if not phone.isascii():
+        phone = phone.encode("ascii", "ignore").decode("ascii")
+    digits = phone.translate(_STRIP_NON_DIGITS)
 
     # Remove leading 1 for US numbers (11 digits starting with 1)
     if len(digits) == 11 and digits.startswith("1"):
@@ -65,11 +143,12 @@ def _customer_matches_phone(customer: dict, normalized_phone: str) -> bool:
     if not normalized_phone or len(normalized_phone) < 7:
         return False
 
-    customer_phones = [
-        normalize_phone(customer.get("phone") or ""),
-        normalize_phone(customer.get("secondaryPhone") or ""),
-    ]
-    return normalized_phone in customer_phones
+    # Primary phone is the common hit; only check secondaryPhone on a miss
+    phone = customer.get("phone")
+    if phone and normalize_phone(phone) == normalized_phone:
+        return True
+    secondary = customer.get("secondaryPhone")
+    return bool(secondary) and normalize_phone(secondary) == normalized_phone
 
 
 def _lead_matches_phone(lead: dict, normalized_phone: str) -> bool:
@@ -87,11 +166,35 @@ def _lead_matches_phone(lead: dict, normalized_phone: str) -> bool:
     if not normalized_phone or len(normalized_phone) < 7:
         return False
 
-    lead_phones = [
-        normalize_phone(lead.get("phone") or ""),
-        normalize_phone(lead.get("secondaryPhone") or ""),
-    ]
-    return normalized_phone in lead_phones
+    # Primary phone is the common hit; only check secondaryPhone on a miss
+    phone = lead.get("phone")
+    if phone and normalize_phone(phone) == normalized_phone:
+        return True
+    secondary = lead.get("secondaryPhone")
+    return bool(secondary) and normalize_phone(secondary) == normalized_phone
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """
+    How long to wait after a 429 response.
+
+    Uses the Retry-After header (delta-seconds or HTTP-date) when present,
+    otherwise falls back to waiting out AgencyZoom's one-minute window.
+    A little jitter keeps concurrent retries from landing together.
+    """
+    jitter = random.uniform(0, 1)
+    value = response.headers.get("Retry-After")
+    if value:
+        try:
+            return max(1.0, float(value)) + jitter
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(1.0, (retry_at - datetime.now(timezone.utc)).total_seconds()) + jitter
+        except (TypeError, ValueError):
+            pass
+    return RATE_LIMIT_RETRY_SECONDS + jitter
 
 
 async def _make_request(method: str, endpoint: str, **kwargs) -> httpx.Response:
@@ -99,61 +202,52 @@ async def _make_request(method: str, endpoint: str, **kwargs) -> httpx.Response:
     Make an authenticated request to AgencyZoom API.
 
     Handles:
-    - Proactive rate limiting (delay between requests)
+    - Proactive rate limiting (shared token bucket)
     - Token refresh on 401 errors
-    - Rate limiting (429) with automatic retry after waiting
+    - Rate limiting (429) with automatic retry after Retry-After
     """
-    global _last_request_time
-
-    # Proactive rate limiting - ensure minimum delay between requests
-    if _last_request_time is not None:
-        elapsed = (datetime.utcnow() - _last_request_time).total_seconds()
-        if elapsed < REQUEST_DELAY_SECONDS:
-            wait_time = REQUEST_DELAY_SECONDS - elapsed
-            await asyncio.sleep(wait_time)
-
-    _last_request_time = datetime.utcnow()
     headers = await get_auth_headers()
 
+    client = await get_client()
+
     for attempt in range(MAX_RETRIES):
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(
-                method,
-                f"{settings.agencyzoom_api_url}{endpoint}",
-                headers=headers,
-                **kwargs,
-            )
-
-            # Handle unauthorized - refresh token and retry
+        # Proactive rate limiting - wait for a token from the shared bucket
+        await _bucket.acquire()
+
+        async with _upstream_sem:
+            response = await client.request(method, endpoint, headers=headers, **kwargs)
+
+        # Handle unauthorized - refresh token and retry
+        if response.status_code == 401:
+            logger.warning("Got 401, clearing token cache and retrying")
+            clear_token_cache()
+            headers = await get_auth_headers()
+            async with _upstream_sem:
+                response = await client.request(method, endpoint, headers=headers, **kwargs)
+            # If still 401 after refresh, return the error
             if response.status_code == 401:
-                logger.warning("Got 401, clearing token cache and retrying")
-                clear_token_cache()
-                headers = await get_auth_headers()
-                response = await client.request(
-                    method,
-                    f"{settings.agencyzoom_api_url}{endpoint}",
-                    headers=headers,
-                    **kwargs,
+                return response
+
+        # Handle rate limiting - wait and retry
+        if response.status_code == 429:
+            if attempt < MAX_RETRIES - 1:
+                delay = _retry_after_seconds(response)
+                logger.warning(
+                    "Rate limited by AgencyZoom (attempt %d/%d). "
+                    "Waiting %.1f seconds before retry...",
+                    attempt + 1,
+                    MAX_RETRIES,
+                    delay,
                 )
-                # If still 401 after refresh, return the error
-                if response.status_code == 401:
-                    return response
-
-            # Handle rate limiting - wait and retry
-            if response.status_code == 429:
-                if attempt < MAX_RETRIES - 1:
-                    logger.warning(
-                        f"Rate limited by AgencyZoom (attempt {attempt + 1}/{MAX_RETRIES}). "
-                        f"Waiting {RATE_LIMIT_RETRY_SECONDS} seconds before retry..."
-                    )
-                    await asyncio.sleep(RATE_LIMIT_RETRY_SECONDS)
-                    continue
-                else:
-                    logger.error("Rate limited by AgencyZoom - max retries exceeded")
-                    return response
+                # Hold back every caller, including this retry, until the window reopens
+                _bucket.pause(delay)
+                continue
+            else:
+                logger.error("Rate limited by AgencyZoom - max retries exceeded")
+                return response
 
-            # Success or other error - return response
-            return response
+        # Success or other error - return response
+        return response
 
     # Should not reach here, but return last response if we do
     return response
@@ -193,16 +287,18 @@ async def search_customers(
     if name:
         payload["fullName"] = name  # AgencyZoom uses fullName for name search
 
-    logger.info(f"Searching customers with: {payload}")
+    logger.info("Searching customers with: %s", payload)
 
-    response = await _make_request("POST", "/v1/api/customers", json=payload)
+    response = await _make_request(
+        "POST", "/v1/api/customers", content=orjson.dumps(payload)
+    )
 
     if response.status_code != 200:
-        logger.error(f"Customer search failed: {response.status_code} - {response.text}")
+        logger.error("Customer search failed: %s - %s", response.status_code, response.text)
         return {"customers": [], "total": 0, "error": response.text}
 
-    data = response.json()
-    logger.info(f"Customer search raw response: {data}")
+    data = orjson.loads(response.content)
+    logger.info("Customer search raw response: %s", data)
 
     # Handle the response format from AgencyZoom
     # API returns {"totalCount": N, "customers": [...]}
@@ -251,16 +347,18 @@ async def search_leads(
     if name:
         payload["customerName"] = name
 
-    logger.info(f"Searching leads with: {payload}")
+    logger.info("Searching leads with: %s", payload)
 
-    response = await _make_request("POST", "/v1/api/leads/list", json=payload)
+    response = await _make_request(
+        "POST", "/v1/api/leads/list", content=orjson.dumps(payload)
+    )
 
     if response.status_code != 200:
-        logger.error(f"Lead search failed: {response.status_code} - {response.text}")
+        logger.error("Lead search failed: %s - %s", response.status_code, response.text)
         return {"leads": [], "total": 0, "error": response.text}
 
-    data = response.json()
-    logger.info(f"Lead search raw response: {data}")
+    data = orjson.loads(response.content)
+    logger.info("Lead search raw response: %s", data)
 
     # Handle the response format from AgencyZoom
     # API likely returns {"totalCount": N, "leads": [...]}
@@ -275,26 +373,18 @@ async def search_leads(
     }
 
 
-async def search_by_phone(phone: str) -> dict:
-    """
-    Search for both customers and leads by phone number.
-
-    This is the main function for the outgoing call workflow.
-    Results are verified to ensure the returned customers/leads actually
-    have a phone number matching what we searched for.
+# Lookups currently running, keyed by normalized phone, so simultaneous
+# searches for the same number share one pair of upstream calls
+_inflight_searches: dict[str, asyncio.Task] = {}
 
-    Args:
-        phone: Phone number to search for
-
-    Returns:
-        dict with 'customers' and 'leads' lists (verified matches only)
-    """
-    normalized = normalize_phone(phone)
-    logger.info(f"Searching by phone: {phone} (normalized: {normalized})")
 
-    # Search both customers and leads
-    customers_result = await search_customers(phone=normalized)
-    leads_result = await search_leads(phone=normalized)
+async def _search_verified(normalized: str) -> tuple[list, list]:
+    """Search customers and leads for a normalized phone, keeping verified matches only."""
+    # Search both customers and leads concurrently
+    customers_result, leads_result = await asyncio.gather(
+        search_customers(phone=normalized),
+        search_leads(phone=normalized),
+    )
 
     # Get raw results from API
     raw_customers = customers_result.get("customers", [])
@@ -304,23 +394,55 @@ async def search_by_phone(phone: str) -> dict:
     # AgencyZoom may return fuzzy matches that don't actually match
     verified_customers = [
         c for c in raw_customers if _customer_matches_phone(c, normalized)
-    ]
+    ] if raw_customers else []
     verified_leads = [
         l for l in raw_leads if _lead_matches_phone(l, normalized)
-    ]
+    ] if raw_leads else []
 
     # Log if we filtered out any non-matching results
     if len(verified_customers) < len(raw_customers):
         filtered_count = len(raw_customers) - len(verified_customers)
         logger.warning(
-            f"Filtered out {filtered_count} customer(s) that didn't match phone {normalized}"
+            "Filtered out %d customer(s) that didn't match phone %s", filtered_count, normalized
         )
     if len(verified_leads) < len(raw_leads):
         filtered_count = len(raw_leads) - len(verified_leads)
         logger.warning(
-            f"Filtered out {filtered_count} lead(s) that didn't match phone {normalized}"
+            "Filtered out %d lead(s) that didn't match phone %s", filtered_count, normalized
         )
 
+    return verified_customers, verified_leads
+
+
+async def search_by_phone(phone: str) -> dict:
+    """
+    Search for both customers and leads by phone number.
+
+    This is the main function for the outgoing call workflow.
+    Results are verified to ensure the returned customers/leads actually
+    have a phone number matching what we searched for. Concurrent searches
+    for the same number are coalesced into a single upstream lookup.
+
+    Args:
+        phone: Phone number to search for
+
+    Returns:
+        dict with 'customers' and 'leads' lists (verified matches only)
+    """
+    normalized = normalize_phone(phone)
+    logger.info("Searching by phone: %s (normalized: %s)", phone, normalized)
+
+    task = _inflight_searches.get(normalized)
+    if task is None:
+        task = asyncio.ensure_future(_search_verified(normalized))
+        _inflight_searches[normalized] = task
+        task.add_done_callback(lambda _: _inflight_searches.pop(normalized, None))
+    else:
+        logger.info("Joining in-flight search for %s", normalized)
+
+    # Shield so one caller disconnecting doesn't cancel the lookup for the others
+    verified_customers, verified_leads = await asyncio.shield(task)
+
     return {
         "phone": phone,
         "normalized_phone": normalized,
@@ -349,25 +471,60 @@ async def create_customer_note(
         "note": content,
     }
 
-    logger.info(f"Creating note for customer {customer_id}")
+    logger.info("Creating note for customer %s", customer_id)
 
     response = await _make_request(
         "POST",
         f"/v1/api/customers/{customer_id}/notes",
-        json=payload,
+        content=orjson.dumps(payload),
     )
 
     if response.status_code not in (200, 201):
-        logger.error(f"Create customer note failed: {response.status_code} - {response.text}")
-        return {"success": False, "error": response.text}
+        logger.error(
+            "Create customer note failed: %s - %s", response.status_code, response.text
+        )
+        return {"success": False, "customer_id": customer_id, "error": response.text}
 
     return {
         "success": True,
         "customer_id": customer_id,
-        "data": response.json() if response.text else {},
+        "data": orjson.loads(response.content) if response.content else {},
     }
 
 
+async def create_customer_notes_bulk(items: list[tuple[str, str]]) -> list[dict]:
+    """
+    Create several customer notes concurrently.
+
+    Requests are issued together and admitted by the shared rate limiter,
+    multiplexing over the shared HTTP/2 connection.
+
+    Args:
+        items: (customer_id, content) pairs
+
+    Returns:
+        One {success, customer_id, error, data} dict per item, in the same order
+    """
+    if len(items) > MAX_BULK_NOTES:
+        raise ValueError(f"At most {MAX_BULK_NOTES} notes per bulk request")
+
+    results = await asyncio.gather(
+        *(create_customer_note(customer_id, content) for customer_id, content in items),
+        return_exceptions=True,
+    )
+    entries = []
+    for (customer_id, _), result in zip(items, results):
+        if isinstance(result, Exception):
+            result = {"error": str(result)}
+        entries.append({
+            "success": bool(result.get("success")),
+            "customer_id": customer_id,
+            "error": result.get("error"),
+            "data": result.get("data"),
+        })
+    return entries
+
+
 async def create_lead_note(
     lead_id: str,
     content: str,
@@ -387,22 +544,22 @@ async def create_lead_note(
         "note": content,
     }
 
-    logger.info(f"Creating note for lead {lead_id}")
+    logger.info("Creating note for lead %s", lead_id)
 
     response = await _make_request(
         "POST",
         f"/v1/api/leads/{lead_id}/notes",
-        json=payload,
+        content=orjson.dumps(payload),
     )
 
     if response.status_code not in (200, 201):
-        logger.error(f"Create lead note failed: {response.status_code} - {response.text}")
+        logger.error("Create lead note failed: %s - %s", response.status_code, response.text)
         return {"success": False, "error": response.text}
 
     return {
         "success": True,
         "lead_id": lead_id,
-        "data": response.json() if response.text else {},
+        "data": orjson.loads(response.content) if response.content else {},
     }
 
 
@@ -411,10 +568,10 @@ async def get_customer(customer_id: str) -> Optional[dict]:
     response = await _make_request("GET", f"/v1/api/customers/{customer_id}")
 
     if response.status_code != 200:
-        logger.error(f"Get customer failed: {response.status_code}")
+        logger.error("Get customer failed: %s", response.status_code)
         return None
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 async def get_lead(lead_id: str) -> Optional[dict]:
@@ -422,10 +579,10 @@ async def get_lead(lead_id: str) -> Optional[dict]:
     response = await _make_request("GET", f"/v1/api/leads/{lead_id}")
 
     if response.status_code != 200:
-        logger.error(f"Get lead failed: {response.status_code}")
+        logger.error("Get lead failed: %s", response.status_code)
         return None
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 async def create_task(
@@ -472,19 +629,21 @@ async def create_task(
     if comments:
         payload["comments"] = comments
 
-    logger.info(f"Creating task: {title} for assignee {assignee_id}")
+    logger.info("Creating task: %s for assignee %s", title, assignee_id)
 
-    response = await _make_request("POST", "/v1/api/tasks", json=payload)
+    response = await _make_request(
+        "POST", "/v1/api/tasks", content=orjson.dumps(payload)
+    )
 
     if response.status_code not in (200, 201):
-        logger.error(f"Create task failed: {response.status_code} - {response.text}")
+        logger.error("Create task failed: %s - %s", response.status_code, response.text)
         return {"success": False, "error": response.text}
 
     return {
         "success": True,
         "customer_id": customer_id,
         "lead_id": lead_id,
-        "data": response.json() if response.text else {},
+        "data": orjson.loads(response.content) if response.content else {},
     }
 
 
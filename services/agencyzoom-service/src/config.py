@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     # Token caching (how long before expiry to refresh, in seconds)
     token_refresh_buffer: int = 300  # Refresh 5 minutes before expiry
 
+    # Maximum simultaneous requests to AgencyZoom (also sizes the connection pool)
+    agencyzoom_max_concurrency: int = 20
+
     # Logging
     log_level: str = "INFO"
 
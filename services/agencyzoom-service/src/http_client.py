@@ -0,0 +1,39 @@
+"""Shared HTTP client for calling the AgencyZoom API."""
+
+from typing import Optional
+
+import httpx
+
+from .config import get_settings
+
+settings = get_settings()
+
+# Shared HTTP client with connection pooling
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _client
+    if _client is None:
+        # HTTP/2 lets concurrent calls (e.g. customer + lead search) share one
+        # connection to the single AgencyZoom host
+        _client = httpx.AsyncClient(
+            base_url=settings.agencyzoom_api_url,
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(
+                max_connections=settings.agencyzoom_max_concurrency,
+                max_keepalive_connections=settings.agencyzoom_max_concurrency,
+                keepalive_expiry=300.0,
+            ),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the HTTP client (call on shutdown)."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
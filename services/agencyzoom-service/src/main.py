@@ -6,15 +6,20 @@ and creating notes in AgencyZoom.
 """
 
 import logging
-from datetime import datetime
+import time
+from contextlib import asynccontextmanager
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 from .config import get_settings
 from . import client
-from .auth import get_access_token, clear_token_cache
+from .auth import get_access_token, get_auth_headers, clear_token_cache
+from .http_client import close_client, get_client
 
 # Configure logging
 settings = get_settings()
@@ -24,20 +29,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown logic."""
+    # Build the OpenAPI schema now rather than on the first /docs request
+    app.openapi()
+
+    yield
+
+    # Shutdown
+    await close_client()
+
+
+# Path prefix the reverse proxy mounts this service under
+ROOT_PATH = "/api/agencyzoom"
+
 # Create FastAPI app
 app = FastAPI(
     title="AgencyZoom Service",
     description="API integration for AgencyZoom CRM",
     version="1.0.0",
-    root_path="/api/agencyzoom",
+    root_path=ROOT_PATH,
+    lifespan=lifespan,
+    # Serialize every response with orjson rather than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
+# Search results can run to tens of KB; small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # =============================================================================
 # MODELS
 # =============================================================================
 
 
+class RequestModel(BaseModel):
+    """Base for request bodies - parsed once per request and never mutated."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
@@ -51,7 +83,7 @@ class ConnectionTestResponse(BaseModel):
     message: str
 
 
-class SearchByPhoneRequest(BaseModel):
+class SearchByPhoneRequest(RequestModel):
     """Request to search by phone number."""
     phone: str
 
@@ -65,7 +97,7 @@ class SearchByPhoneResponse(BaseModel):
     has_match: bool
 
 
-class CustomerSearchRequest(BaseModel):
+class CustomerSearchRequest(RequestModel):
     """Request to search customers."""
     phone: Optional[str] = None
     email: Optional[str] = None
@@ -74,7 +106,7 @@ class CustomerSearchRequest(BaseModel):
     page_size: int = 20
 
 
-class LeadSearchRequest(BaseModel):
+class LeadSearchRequest(RequestModel):
     """Request to search leads."""
     phone: Optional[str] = None
     email: Optional[str] = None
@@ -83,11 +115,36 @@ class LeadSearchRequest(BaseModel):
     page_size: int = 20
 
 
-class CreateNoteRequest(BaseModel):
+class CreateNoteRequest(RequestModel):
     """Request to create a note."""
     content: str  # Note content (can include HTML)
 
 
+class BulkCustomerNote(RequestModel):
+    """A single note in a bulk customer note request."""
+    customer_id: str
+    content: str  # Note content (can include HTML)
+
+
+class BulkCreateCustomerNotesRequest(RequestModel):
+    """Request to create several customer notes at once."""
+    # Every note waits on the shared rate limiter; keep one call to ~a minute
+    notes: list[BulkCustomerNote] = Field(..., min_length=1, max_length=client.MAX_BULK_NOTES)
+
+
+class BulkNoteResult(BaseModel):
+    """Outcome of one note in a bulk request."""
+    success: bool
+    customer_id: str
+    error: Optional[str] = None
+    data: Optional[dict] = None  # AgencyZoom's response for created notes
+
+
+class BulkCreateCustomerNotesResponse(BaseModel):
+    """Per-note results of a bulk request, in request order."""
+    results: list[BulkNoteResult]
+
+
 class CreateNoteResponse(BaseModel):
     """Response from note creation."""
     success: bool
@@ -96,7 +153,7 @@ class CreateNoteResponse(BaseModel):
     error: Optional[str] = None
 
 
-class CreateTaskRequest(BaseModel):
+class CreateTaskRequest(RequestModel):
     """Request to create a task."""
     title: str
     due_datetime: str  # ISO format datetime
@@ -122,16 +179,80 @@ class CreateTaskResponse(BaseModel):
 # =============================================================================
 
 
-@app.get("/health", response_model=HealthResponse, tags=["health"])
-async def health_check():
-    """Basic health check."""
-    return HealthResponse(
-        status="healthy",
-        service="agencyzoom-service",
-        timestamp=datetime.utcnow().isoformat(),
+def _iso_now(t: Optional[float] = None) -> str:
+    """UTC ISO-8601 timestamp for `t` (default: now), formatted without datetime."""
+    if t is None:
+        t = time.time()
+    g = time.gmtime(t)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%06dZ" % (
+        g.tm_year, g.tm_mon, g.tm_mday, g.tm_hour, g.tm_min, g.tm_sec,
+        int(t % 1 * 1_000_000),
     )
 
 
+# Health body, regenerated at most once per second
+_health_cache = {"second": None, "body": b""}
+
+
+def _health_body() -> bytes:
+    """Serialized /health response for the current second."""
+    now = int(time.time())
+    if now != _health_cache["second"]:
+        _health_cache["second"] = now
+        _health_cache["body"] = orjson.dumps({
+            "status": "healthy",
+            "service": "agencyzoom-service",
+            "timestamp": _iso_now(now),
+        })
+    return _health_cache["body"]
+
+
+class HealthShortCircuit:
+    """
+    ASGI middleware that answers GET /health before routing.
+
+    Liveness probes hit /health every few seconds; this skips Starlette
+    routing and the middleware stack and sends the cached body directly.
+    """
+
+    def __init__(self, app, path: str = "/health"):
+        self.app = app
+        # Match with or without the proxy prefix
+        self.paths = {path, ROOT_PATH + path}
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] in self.paths
+            and scope["method"] in ("GET", "HEAD")
+        ):
+            body = _health_body()
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(HealthShortCircuit)
+
+
+@app.get(
+    "/health",
+    responses={200: {"model": HealthResponse}},
+    tags=["health"],
+)
+async def health_check():
+    """Basic health check (normally answered by HealthShortCircuit)."""
+    return Response(_health_body(), media_type="application/json")
+
+
 @app.get("/health/ready", response_model=HealthResponse, tags=["health"])
 async def readiness_check():
     """Readiness check - verifies AgencyZoom connection."""
@@ -141,10 +262,10 @@ async def readiness_check():
         return HealthResponse(
             status="ready",
             service="agencyzoom-service",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_iso_now(),
         )
     except Exception as e:
-        logger.error(f"Readiness check failed: {e}")
+        logger.exception("Readiness check failed")
         raise HTTPException(status_code=503, detail=f"AgencyZoom not ready: {str(e)}")
 
 
@@ -158,7 +279,7 @@ async def test_connection():
             message="Successfully authenticated with AgencyZoom API",
         )
     except Exception as e:
-        logger.error(f"Connection test failed: {e}")
+        logger.exception("Connection test failed")
         raise HTTPException(status_code=503, detail=str(e))
 
 
@@ -174,7 +295,11 @@ async def clear_cache():
 # =============================================================================
 
 
-@app.post("/search/phone", response_model=SearchByPhoneResponse, tags=["search"])
+@app.post(
+    "/search/phone",
+    responses={200: {"model": SearchByPhoneResponse}},
+    tags=["search"],
+)
 async def search_by_phone(request: SearchByPhoneRequest):
     """
     Search for customers and leads by phone number.
@@ -186,13 +311,18 @@ async def search_by_phone(request: SearchByPhoneRequest):
     """
     try:
         result = await client.search_by_phone(request.phone)
-        return SearchByPhoneResponse(**result)
+        # Already the SearchByPhoneResponse shape - skip re-validation
+        return ORJSONResponse(result)
     except Exception as e:
-        logger.error(f"Phone search failed: {e}")
+        logger.exception("Phone search failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/search/phone/{phone}", response_model=SearchByPhoneResponse, tags=["search"])
+@app.get(
+    "/search/phone/{phone}",
+    responses={200: {"model": SearchByPhoneResponse}},
+    tags=["search"],
+)
 async def search_by_phone_get(phone: str):
     """
     Search for customers and leads by phone number (GET version).
@@ -201,9 +331,10 @@ async def search_by_phone_get(phone: str):
     """
     try:
         result = await client.search_by_phone(phone)
-        return SearchByPhoneResponse(**result)
+        # Already the SearchByPhoneResponse shape - skip re-validation
+        return ORJSONResponse(result)
     except Exception as e:
-        logger.error(f"Phone search failed: {e}")
+        logger.exception("Phone search failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -215,7 +346,7 @@ async def search_customers(request: CustomerSearchRequest):
     - **phone**: Filter by phone number
     - **email**: Filter by email
     - **name**: Filter by name
-    - **page**: Page number (1-indexed)
+    - **page**: Page number (0-indexed)
     - **page_size**: Results per page
     """
     try:
@@ -226,9 +357,10 @@ async def search_customers(request: CustomerSearchRequest):
             page=request.page,
             page_size=request.page_size,
         )
-        return result
+        # Decoded upstream JSON - hand straight to orjson, no jsonable_encoder pass
+        return ORJSONResponse(result)
     except Exception as e:
-        logger.error(f"Customer search failed: {e}")
+        logger.exception("Customer search failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -240,7 +372,7 @@ async def search_leads(request: LeadSearchRequest):
     - **phone**: Filter by phone number
     - **email**: Filter by email
     - **name**: Filter by name
-    - **page**: Page number (1-indexed)
+    - **page**: Page number (0-indexed)
     - **page_size**: Results per page
     """
     try:
@@ -251,9 +383,10 @@ async def search_leads(request: LeadSearchRequest):
             page=request.page,
             page_size=request.page_size,
         )
-        return result
+        # Decoded upstream JSON - hand straight to orjson, no jsonable_encoder pass
+        return ORJSONResponse(result)
     except Exception as e:
-        logger.error(f"Lead search failed: {e}")
+        logger.exception("Lead search failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -269,15 +402,19 @@ async def get_customer(customer_id: str):
         customer = await client.get_customer(customer_id)
         if not customer:
             raise HTTPException(status_code=404, detail="Customer not found")
-        return customer
+        return ORJSONResponse(customer)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get customer failed: {e}")
+        logger.exception("Get customer failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/customers/{customer_id}/notes", response_model=CreateNoteResponse, tags=["customers"])
+@app.post(
+    "/customers/{customer_id}/notes",
+    responses={200: {"model": CreateNoteResponse}},
+    tags=["customers"],
+)
 async def create_customer_note(customer_id: str, request: CreateNoteRequest):
     """
     Create a note for a customer.
@@ -294,17 +431,39 @@ async def create_customer_note(customer_id: str, request: CreateNoteRequest):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to create note"))
 
-        return CreateNoteResponse(
-            success=True,
-            customer_id=customer_id,
-        )
+        return ORJSONResponse({
+            "success": True,
+            "customer_id": customer_id,
+            "lead_id": None,
+            "error": None,
+        })
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create customer note failed: {e}")
+        logger.exception("Create customer note failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post(
+    "/customers/notes/bulk",
+    responses={200: {"model": BulkCreateCustomerNotesResponse}},
+    tags=["customers"],
+)
+async def create_customer_notes_bulk(request: BulkCreateCustomerNotesRequest):
+    """
+    Create notes for several customers in one call.
+
+    Notes are sent to AgencyZoom concurrently, subject to the rate limit.
+    Returns one {success, customer_id, error, data} result per note, in request order.
+
+    - **notes**: List of {customer_id, content}; batches are capped (422 if larger)
+    """
+    results = await client.create_customer_notes_bulk(
+        [(note.customer_id, note.content) for note in request.notes]
+    )
+    return {"results": results}
+
+
 # =============================================================================
 # LEAD ENDPOINTS
 # =============================================================================
@@ -317,15 +476,19 @@ async def get_lead(lead_id: str):
         lead = await client.get_lead(lead_id)
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
-        return lead
+        return ORJSONResponse(lead)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get lead failed: {e}")
+        logger.exception("Get lead failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/leads/{lead_id}/notes", response_model=CreateNoteResponse, tags=["leads"])
+@app.post(
+    "/leads/{lead_id}/notes",
+    responses={200: {"model": CreateNoteResponse}},
+    tags=["leads"],
+)
 async def create_lead_note(lead_id: str, request: CreateNoteRequest):
     """
     Create a note for a lead.
@@ -342,14 +505,16 @@ async def create_lead_note(lead_id: str, request: CreateNoteRequest):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to create note"))
 
-        return CreateNoteResponse(
-            success=True,
-            lead_id=lead_id,
-        )
+        return ORJSONResponse({
+            "success": True,
+            "customer_id": None,
+            "lead_id": lead_id,
+            "error": None,
+        })
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create lead note failed: {e}")
+        logger.exception("Create lead note failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -358,7 +523,11 @@ async def create_lead_note(lead_id: str, request: CreateNoteRequest):
 # =============================================================================
 
 
-@app.post("/tasks", response_model=CreateTaskResponse, tags=["tasks"])
+@app.post(
+    "/tasks",
+    responses={200: {"model": CreateTaskResponse}},
+    tags=["tasks"],
+)
 async def create_task(request: CreateTaskRequest):
     """
     Create a task in AgencyZoom.
@@ -389,45 +558,46 @@ async def create_task(request: CreateTaskRequest):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to create task"))
 
-        return CreateTaskResponse(
-            success=True,
-            customer_id=request.customer_id,
-            lead_id=request.lead_id,
-        )
+        return ORJSONResponse({
+            "success": True,
+            "customer_id": request.customer_id,
+            "lead_id": request.lead_id,
+            "error": None,
+        })
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Create task failed: {e}")
+        logger.exception("Create task failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/customers/{customer_id}/csr", tags=["customers"])
-async def get_customer_csr(customer_id: str):
+async def get_customer_csr(customer_id: int):
     """Get the primary CSR ID for a customer."""
     try:
-        csr_id = await client.get_customer_csr_id(int(customer_id))
+        csr_id = await client.get_customer_csr_id(customer_id)
         if csr_id is None:
             raise HTTPException(status_code=404, detail="CSR not found for customer")
         return {"customer_id": customer_id, "csr_id": csr_id}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get customer CSR failed: {e}")
+        logger.exception("Get customer CSR failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/leads/{lead_id}/producer", tags=["leads"])
-async def get_lead_producer(lead_id: str):
+async def get_lead_producer(lead_id: int):
     """Get the primary producer/agent ID for a lead."""
     try:
-        producer_id = await client.get_lead_producer_id(int(lead_id))
+        producer_id = await client.get_lead_producer_id(lead_id)
         if producer_id is None:
             raise HTTPException(status_code=404, detail="Producer not found for lead")
         return {"lead_id": lead_id, "producer_id": producer_id}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get lead producer failed: {e}")
+        logger.exception("Get lead producer failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -436,6 +606,12 @@ async def get_lead_producer(lead_id: str):
 # =============================================================================
 
 
+@app.get("/debug/pool-stats", tags=["debug"])
+async def debug_pool_stats():
+    """Debug endpoint: How many upstream AgencyZoom requests are in flight."""
+    return client.pool_stats()
+
+
 @app.get("/debug/raw-customer-search/{phone}", tags=["debug"])
 async def debug_raw_customer_search(phone: str):
     """
@@ -443,9 +619,6 @@ async def debug_raw_customer_search(phone: str):
 
     This helps diagnose issues with the AgencyZoom API response format.
     """
-    import httpx
-    from .auth import get_auth_headers
-
     normalized = client.normalize_phone(phone)
     headers = await get_auth_headers()
 
@@ -455,12 +628,8 @@ async def debug_raw_customer_search(phone: str):
         "phone": normalized,
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as http_client:
-        response = await http_client.post(
-            f"{settings.agencyzoom_api_url}/v1/api/customers",
-            headers=headers,
-            json=payload,
-        )
+    http_client = await get_client()
+    response = await http_client.post("/v1/api/customers", headers=headers, json=payload)
 
     return {
         "input_phone": phone,
@@ -0,0 +1,25 @@
+"""UTC timestamp helpers for status messages and health checks."""
+
+import time
+
+# Last timestamp handed out, keyed by the wall-clock millisecond it was made in
+_cache = {"ms": -1, "iso": ""}
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as ISO-8601 with a +00:00 offset.
+
+    Formatted from time.time_ns() without building a datetime, and reused
+    for every call within the same millisecond.
+    """
+    ns = time.time_ns()
+    ms = ns // 1_000_000
+    if ms != _cache["ms"]:
+        g = time.gmtime(ns // 1_000_000_000)
+        _cache["ms"] = ms
+        _cache["iso"] = "%04d-%02d-%02dT%02d:%02d:%02d.%06d+00:00" % (
+            g.tm_year, g.tm_mon, g.tm_mday, g.tm_hour, g.tm_min, g.tm_sec,
+            ns // 1_000 % 1_000_000,
+        )
+    return _cache["iso"]
@@ -1,23 +1,34 @@
 """Configuration for the dashboard service."""
 
 from functools import lru_cache
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
+# Read-only so the cached Settings can't be changed out from under callers
+DEFAULT_SERVICES: Mapping[str, str] = MappingProxyType({
+    "ringcentral-service": "http://ringcentral-service:8000/api/ringcentral/health",
+    "storage-service": "http://storage-service:8000/api/storage/health",
+    "agencyzoom-service": "http://agencyzoom-service:8000/api/agencyzoom/health",
+    "workflow-service": "http://workflow-service:8000/api/workflows/health",
+    "test-service": "http://test-service:8000/api/test/health",
+    "deputy-service": "http://deputy-service:8000/api/deputy/health",
+})
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # Services to monitor (internal Docker network URLs)
-    services: dict = {
-        "ringcentral-service": "http://ringcentral-service:8000/api/ringcentral/health",
-        "storage-service": "http://storage-service:8000/api/storage/health",
-        "agencyzoom-service": "http://agencyzoom-service:8000/api/agencyzoom/health",
-        "workflow-service": "http://workflow-service:8000/api/workflows/health",
-        "test-service": "http://test-service:8000/api/test/health",
-        "deputy-service": "http://deputy-service:8000/api/deputy/health",
-    }
+    services: Mapping[str, str] = Field(default_factory=lambda: DEFAULT_SERVICES)
+
+    @field_validator("services", mode="after")
+    @classmethod
+    def _freeze_services(cls, value: Mapping[str, str]) -> Mapping[str, str]:
+        """Validation hands back a plain dict; wrap it so it stays read-only."""
+        return MappingProxyType(dict(value))
 
     # Employee status API key (for Windows desktop app authentication)
     # If not set, one will be generated on startup
@@ -33,6 +44,9 @@ class Settings(BaseSettings):
     # RingCentral service URL for checking presence on startup
     ringcentral_service_url: str = "http://ringcentral-service:8000"
 
+    # Workflow service URL for the dashboard's workflow and scheduler tables
+    workflow_service_url: str = "http://workflow-service:8000"
+
     # Logging
     log_level: str = "INFO"
 
@@ -6,15 +6,23 @@ Tracks employee clock-in/out and break status, broadcasts updates to connected c
 import asyncio
 import logging
 import secrets
-from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+import orjson
 from fastapi import WebSocket
 from pydantic import BaseModel
 
+from .clock import utc_now_iso
+
 logger = logging.getLogger(__name__)
 
+# Messages buffered per client before pending updates are collapsed into a snapshot
+CLIENT_QUEUE_SIZE = 32
+
+# Reply to an application-level "ping"; constant, so built once
+PONG_MESSAGE = '{"type": "pong"}'
+
 
 class ClockStatus(str, Enum):
     """Employee clock status values."""
@@ -36,7 +44,10 @@ class EmployeeStatus(BaseModel):
 
 
 class StatusUpdate(BaseModel):
-    """A status update message for WebSocket broadcast."""
+    """A status update message for WebSocket broadcast.
+
+    Documents the wire format; update_status serializes a plain dict of this shape.
+    """
 
     type: str = "status_update"
     employee_id: str
@@ -46,7 +57,10 @@ class StatusUpdate(BaseModel):
 
 
 class AllStatusMessage(BaseModel):
-    """Message containing all employee statuses."""
+    """Message containing all employee statuses.
+
+    send_all_statuses writes this shape directly from a cached employees blob.
+    """
 
     type: str = "all_statuses"
     employees: list[EmployeeStatus]
@@ -57,14 +71,24 @@ class EmployeeStatusManager:
     """Manages employee statuses and WebSocket connections."""
 
     def __init__(self):
-        # In-memory status storage: employee_id -> EmployeeStatus
-        self._statuses: dict[str, EmployeeStatus] = {}
-        # Connected WebSocket clients: websocket -> client_id
-        self._connections: dict[WebSocket, str] = {}
+        # In-memory status storage: employee_id -> EmployeeStatus fields as a
+        # JSON-ready dict, so snapshots serialize without building models
+        self._statuses: dict[str, dict] = {}
+        # Connected WebSocket clients (client_id is kept on websocket.state)
+        self._connections: set[WebSocket] = set()
+        # Per-client outbound queue and the task draining it to the socket
+        self._queues: dict[WebSocket, asyncio.Queue] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
         # Valid API keys for authentication
         self._api_keys: set[str] = set()
-        # Lock for thread-safe operations
-        self._lock = asyncio.Lock()
+        # No lock: every mutation below completes without an await, so it is
+        # atomic with respect to other coroutines on the event loop
+        # Bumped on every change to _statuses; keys the cached snapshot JSON
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot_json = "[]"
+        # Updates that matched the stored status and weren't broadcast
+        self._deduped_updates = 0
 
     def add_api_key(self, key: str) -> None:
         """Add a valid API key for authentication."""
@@ -82,16 +106,25 @@ class EmployeeStatusManager:
 
     async def register_connection(self, websocket: WebSocket, client_id: str) -> None:
         """Register a new WebSocket connection."""
-        async with self._lock:
-            self._connections[websocket] = client_id
-            logger.info(f"Client registered: {client_id} (total: {len(self._connections)})")
+        websocket.state.client_id = client_id
+        self._connections.add(websocket)
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._client_writer(websocket, queue))
+        logger.info(f"Client registered: {client_id} (total: {len(self._connections)})")
 
     async def unregister_connection(self, websocket: WebSocket) -> None:
         """Unregister a WebSocket connection."""
-        async with self._lock:
-            client_id = self._connections.pop(websocket, None)
-            if client_id:
-                logger.info(f"Client unregistered: {client_id} (total: {len(self._connections)})")
+        if websocket not in self._connections:
+            return
+        self._connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        logger.info(
+            f"Client unregistered: {websocket.state.client_id} (total: {len(self._connections)})"
+        )
 
     async def update_status(
         self,
@@ -101,37 +134,51 @@ class EmployeeStatusManager:
         ringcentral_extension_id: Optional[str] = None,
     ) -> None:
         """Update an employee's status and broadcast to all connected clients."""
-        now = datetime.now(timezone.utc).isoformat()
+        now = utc_now_iso()
+        # Plain str once, rather than going through Enum's .value descriptor each use
+        status = clock_status._value_
+
+        # Repeat events (e.g. presence keepalives) only refresh the timestamp
+        prev = self._statuses.get(employee_id)
+        if (
+            prev is not None
+            and prev["clock_status"] == status
+            and prev["name"] == name
+            and prev["ringcentral_extension_id"] == ringcentral_extension_id
+        ):
+            prev["last_updated"] = now
+            self._version += 1
+            self._deduped_updates += 1
+            logger.debug(f"Status unchanged for {name} ({employee_id}), not broadcasting")
+            return
 
-        async with self._lock:
-            self._statuses[employee_id] = EmployeeStatus(
-                employee_id=employee_id,
-                name=name,
-                clock_status=clock_status,
-                last_updated=now,
-                ringcentral_extension_id=ringcentral_extension_id,
-            )
+        self._statuses[employee_id] = {
+            "employee_id": employee_id,
+            "name": name,
+            "clock_status": status,
+            "last_updated": now,
+            "ringcentral_extension_id": ringcentral_extension_id,
+        }
+        self._version += 1
 
-        logger.info(f"Status updated: {name} ({employee_id}) -> {clock_status.value}")
+        logger.info(f"Status updated: {name} ({employee_id}) -> {status}")
 
         # Broadcast update to all connected clients
-        update_message = StatusUpdate(
-            employee_id=employee_id,
-            name=name,
-            clock_status=clock_status,
-            timestamp=now,
-        )
-        await self._broadcast(update_message.model_dump_json())
-
-    async def get_all_statuses(self) -> list[EmployeeStatus]:
-        """Get all employee statuses."""
-        async with self._lock:
-            return list(self._statuses.values())
-
-    async def get_status(self, employee_id: str) -> Optional[EmployeeStatus]:
-        """Get status for a specific employee."""
-        async with self._lock:
-            return self._statuses.get(employee_id)
+        await self._broadcast(orjson.dumps({
+            "type": "status_update",
+            "employee_id": employee_id,
+            "name": name,
+            "clock_status": status,
+            "timestamp": now,
+        }).decode())
+
+    async def get_all_statuses(self) -> list[dict]:
+        """Get all employee statuses (EmployeeStatus-shaped dicts; don't mutate)."""
+        return list(self._statuses.values())
+
+    async def get_status(self, employee_id: str) -> Optional[dict]:
+        """Get status for a specific employee (EmployeeStatus-shaped dict; don't mutate)."""
+        return self._statuses.get(employee_id)
 
     async def initialize_employee(
         self,
@@ -141,48 +188,101 @@ class EmployeeStatusManager:
         clock_status: ClockStatus = ClockStatus.UNKNOWN,
     ) -> None:
         """Initialize an employee in the status tracker without broadcasting."""
-        now = datetime.now(timezone.utc).isoformat()
-        async with self._lock:
-            if employee_id not in self._statuses:
-                self._statuses[employee_id] = EmployeeStatus(
-                    employee_id=employee_id,
-                    name=name,
-                    clock_status=clock_status,
-                    last_updated=now,
-                    ringcentral_extension_id=ringcentral_extension_id,
-                )
+        now = utc_now_iso()
+        if employee_id not in self._statuses:
+            self._statuses[employee_id] = {
+                "employee_id": employee_id,
+                "name": name,
+                "clock_status": clock_status._value_,
+                "last_updated": now,
+                "ringcentral_extension_id": ringcentral_extension_id,
+            }
+            self._version += 1
+
+    async def initialize_employees_bulk(self, records: list[dict]) -> int:
+        """Initialize many employees at once without broadcasting.
+
+        Each record has employee_id, name, clock_status and optionally
+        ringcentral_extension_id. Returns the number of employees added.
+        """
+        now = utc_now_iso()
+        added = 0
+        for record in records:
+            employee_id = record["employee_id"]
+            if employee_id in self._statuses:
+                continue
+            self._statuses[employee_id] = {
+                "employee_id": employee_id,
+                "name": record["name"],
+                "clock_status": record.get("clock_status", ClockStatus.UNKNOWN)._value_,
+                "last_updated": now,
+                "ringcentral_extension_id": record.get("ringcentral_extension_id"),
+            }
+            added += 1
+        if added:
+            self._version += 1
+        return added
+
+    def _employees_json(self) -> str:
+        """JSON array of all statuses, re-serialized only after a change."""
+        if self._snapshot_version != self._version:
+            self._snapshot_json = orjson.dumps(list(self._statuses.values())).decode()
+            self._snapshot_version = self._version
+        return self._snapshot_json
+
+    def _snapshot_message(self) -> str:
+        """Serialized all_statuses message for the current state."""
+        # Every client gets the same snapshot; only the timestamp differs
+        return '{"type":"all_statuses","employees":%s,"timestamp":%s}' % (
+            self._employees_json(),
+            orjson.dumps(utc_now_iso()).decode(),
+        )
 
     async def send_all_statuses(self, websocket: WebSocket) -> None:
         """Send all current statuses to a specific client."""
-        statuses = await self.get_all_statuses()
-        message = AllStatusMessage(
-            employees=statuses,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-        )
+        message = self._snapshot_message()
+        queue = self._queues.get(websocket)
+        if queue is not None:
+            # Registered client - go through its writer so messages stay in order
+            self._enqueue(queue, message)
+            return
         try:
-            await websocket.send_text(message.model_dump_json())
+            await websocket.send_text(message)
         except Exception as e:
             logger.error(f"Failed to send statuses to client: {e}")
 
-    async def _broadcast(self, message: str) -> None:
-        """Broadcast a message to all connected clients."""
-        async with self._lock:
-            connections = list(self._connections.keys())
-
-        if not connections:
-            return
+    async def send_pong(self, websocket: WebSocket) -> None:
+        """Answer a client's "ping" through its writer, so it can't interleave with a broadcast."""
+        queue = self._queues.get(websocket)
+        if queue is not None:
+            self._enqueue(queue, PONG_MESSAGE)
+        else:
+            await websocket.send_text(PONG_MESSAGE)
 
-        # Send to all clients concurrently
-        tasks = []
-        for websocket in connections:
-            tasks.append(self._send_to_client(websocket, message))
+    def _enqueue(self, queue: asyncio.Queue, message: str) -> None:
+        """Queue a message for a client, collapsing its backlog if it has fallen behind."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Each update supersedes the last, so one fresh snapshot replaces the backlog
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(self._snapshot_message())
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+    async def _broadcast(self, message: str) -> None:
+        """Broadcast a message to all connected clients."""
+        # Only queue puts here - a slow client can't hold up the others
+        for queue in tuple(self._queues.values()):
+            self._enqueue(queue, message)
 
-    async def _send_to_client(self, websocket: WebSocket, message: str) -> None:
-        """Send a message to a single client, handling errors."""
+    async def _client_writer(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Send queued messages to a single client until it disconnects."""
         try:
-            await websocket.send_text(message)
+            while True:
+                message = await queue.get()
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.warning(f"Failed to send to client, removing: {e}")
             await self.unregister_connection(websocket)
@@ -192,6 +292,11 @@ class EmployeeStatusManager:
         """Get the number of connected clients."""
         return len(self._connections)
 
+    @property
+    def deduped_update_count(self) -> int:
+        """Get the number of updates skipped because nothing changed."""
+        return self._deduped_updates
+
 
 # Global status manager instance
 status_manager = EmployeeStatusManager()
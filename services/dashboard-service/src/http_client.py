@@ -0,0 +1,29 @@
+"""Shared HTTP client for calling internal microservices."""
+
+from typing import Optional
+
+import httpx
+
+# Shared HTTP client with connection pooling
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _client
+    if _client is None:
+        # Health checks poll every service on each dashboard load; keep
+        # their connections alive between refreshes
+        _client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the HTTP client (call on shutdown)."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
@@ -7,20 +7,31 @@ for the Windows desktop app.
 """
 
 import asyncio
+import gzip
+import hashlib
 import logging
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from uuid import uuid4
 
 import httpx
+import orjson
 from pathlib import Path
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Header, HTTPException, Query
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Header, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
+from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
+from starlette.datastructures import Headers
 
+from .clock import utc_now_iso
 from .config import get_settings
+from .http_client import close_client, get_client
 from .employee_status import (
     ClockStatus,
     EmployeeStatus,
@@ -35,6 +46,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed once; Jinja caches the compiled template and autoescapes .html files
+templates = Jinja2Templates(directory="src/templates")
+
+STATIC_DIR = Path("src/static")
+
+
+def _static_version() -> str:
+    """Short hash of the static assets, used to bust the long-lived browser cache."""
+    digest = hashlib.sha1()
+    for path in sorted(STATIC_DIR.glob("*")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:10]
+
+
+STATIC_VERSION = _static_version()
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets; URLs carry ?v=STATIC_VERSION."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=86400, immutable"
+        return response
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip; q=0 means refused."""
+    gzip_q = star_q = None
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            gzip_q = q
+        elif coding == "*":
+            star_q = q
+    if gzip_q is not None:
+        return gzip_q > 0
+    return bool(star_q)
+
+
+# Routes that negotiate and send their own pre-compressed body
+PRECOMPRESSED_PATHS = frozenset({"/", "/api/dashboard"})
+
+
+class NegotiatedGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that honours q-values and skips pre-compressed routes."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and (
+            scope["path"] in PRECOMPRESSED_PATHS
+            or not accepts_gzip(Headers(scope=scope).get("accept-encoding", ""))
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 async def initialize_employee_statuses():
     """Initialize employee statuses by querying Deputy for current timesheet status."""
@@ -53,20 +129,19 @@ async def _initialize_employees_unknown():
     try:
         from shared import get_all_users
 
-        users = get_all_users()
+        # First call reads user_mappings.json from disk; keep it off the event loop
+        users = await asyncio.to_thread(get_all_users)
         logger.info(f"Initializing {len(users)} employees with unknown status (fallback)")
 
-        for user in users:
-            deputy_id = user.get("deputy_id")
-            name = user.get("name", "Unknown")
-            rc_extension_id = user.get("ringcentral_extension_id")
-
-            await status_manager.initialize_employee(
-                employee_id=deputy_id,
-                name=name,
-                ringcentral_extension_id=rc_extension_id,
-                clock_status=ClockStatus.UNKNOWN,
-            )
+        await status_manager.initialize_employees_bulk([
+            {
+                "employee_id": user.get("deputy_id"),
+                "name": user.get("name", "Unknown"),
+                "ringcentral_extension_id": user.get("ringcentral_extension_id"),
+                "clock_status": ClockStatus.UNKNOWN,
+            }
+            for user in users
+        ])
     except Exception as e:
         logger.error(f"Failed to initialize employees with unknown status: {e}")
 
@@ -76,46 +151,49 @@ async def recover_statuses_from_deputy():
     endpoint = f"{settings.deputy_service_url}/api/deputy/employees/clock-status"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(endpoint)
-
-            if response.status_code == 200:
-                data = response.json()
-                employees = data.get("employees", [])
-                active_count = data.get("active_timesheets_count", 0)
-
-                logger.info(
-                    f"Recovered status from Deputy: {len(employees)} employees, "
-                    f"{active_count} active timesheets"
-                )
-
-                for emp in employees:
-                    employee_id = emp.get("employee_id")
-                    name = emp.get("name", "Unknown")
-                    status_str = emp.get("clock_status", "unknown")
-                    rc_extension_id = emp.get("ringcentral_extension_id")
-
-                    # Map string to ClockStatus enum
-                    status_map = {
-                        "clocked_in": ClockStatus.CLOCKED_IN,
-                        "clocked_out": ClockStatus.CLOCKED_OUT,
-                        "on_break": ClockStatus.ON_BREAK,
-                    }
-                    clock_status = status_map.get(status_str, ClockStatus.UNKNOWN)
-
-                    await status_manager.initialize_employee(
-                        employee_id=employee_id,
-                        name=name,
-                        ringcentral_extension_id=rc_extension_id,
-                        clock_status=clock_status,
-                    )
-                    logger.info(f"Initialized {name}: {clock_status.value}")
-
-            else:
-                logger.error(
-                    f"Failed to query deputy-service: {response.status_code} - {response.text}"
-                )
-                await _initialize_employees_unknown()
+        client = await get_client()
+        response = await client.get(endpoint, timeout=30.0)
+
+        if response.status_code == 200:
+            data = response.json()
+            employees = data.get("employees", [])
+            active_count = data.get("active_timesheets_count", 0)
+
+            logger.info(
+                f"Recovered status from Deputy: {len(employees)} employees, "
+                f"{active_count} active timesheets"
+            )
+
+            # Map string to ClockStatus enum
+            status_map = {
+                "clocked_in": ClockStatus.CLOCKED_IN,
+                "clocked_out": ClockStatus.CLOCKED_OUT,
+                "on_break": ClockStatus.ON_BREAK,
+            }
+            records = [
+                {
+                    "employee_id": emp.get("employee_id"),
+                    "name": emp.get("name", "Unknown"),
+                    "ringcentral_extension_id": emp.get("ringcentral_extension_id"),
+                    "clock_status": status_map.get(
+                        emp.get("clock_status", "unknown"), ClockStatus.UNKNOWN
+                    ),
+                }
+                for emp in employees
+            ]
+            added = await status_manager.initialize_employees_bulk(records)
+
+            counts: dict[str, int] = {}
+            for record in records:
+                status = record["clock_status"].value
+                counts[status] = counts.get(status, 0) + 1
+            logger.info(f"Initialized {added} employees from Deputy: {counts}")
+
+        else:
+            logger.error(
+                f"Failed to query deputy-service: {response.status_code} - {response.text}"
+            )
+            await _initialize_employees_unknown()
 
     except Exception as e:
         logger.error(f"Error querying deputy-service for status recovery: {e}")
@@ -142,6 +220,7 @@ async def lifespan(app: FastAPI):
 
     yield
     logger.info("Dashboard service shutting down...")
+    await close_client()
 
 
 app = FastAPI(
@@ -152,8 +231,16 @@ app = FastAPI(
     redoc_url="/api/dashboard/redoc",
     openapi_url="/api/dashboard/openapi.json",
     lifespan=lifespan,
+    # Serialize JSON responses with orjson rather than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
+# Compress the dashboard HTML and JSON; tiny responses are sent as-is
+app.add_middleware(NegotiatedGZipMiddleware, minimum_size=512)
+
+# Dashboard CSS/JS, cached by the browser across the 30s auto-refreshes
+app.mount("/api/dashboard/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
 
 class ServiceStatus(BaseModel):
     """Status of a single service."""
@@ -193,37 +280,38 @@ class DashboardData(BaseModel):
 
 async def check_service_health(name: str, url: str) -> ServiceStatus:
     """Check the health of a single service."""
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(url)
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-
-            if response.status_code == 200:
-                return ServiceStatus(
-                    name=name,
-                    url=url,
-                    status="healthy",
-                    response_time_ms=round(response_time, 2),
-                    checked_at=datetime.utcnow().isoformat(),
-                )
-            else:
-                return ServiceStatus(
-                    name=name,
-                    url=url,
-                    status="unhealthy",
-                    response_time_ms=round(response_time, 2),
-                    error=f"HTTP {response.status_code}",
-                    checked_at=datetime.utcnow().isoformat(),
-                )
+        client = await get_client()
+        response = await client.get(url)
+        response_time = round((time.perf_counter() - start_time) * 1000, 2)
+        checked_at = utc_now_iso()
+
+        if response.status_code == 200:
+            return ServiceStatus(
+                name=name,
+                url=url,
+                status="healthy",
+                response_time_ms=response_time,
+                checked_at=checked_at,
+            )
+        else:
+            return ServiceStatus(
+                name=name,
+                url=url,
+                status="unhealthy",
+                response_time_ms=response_time,
+                error=f"HTTP {response.status_code}",
+                checked_at=checked_at,
+            )
     except httpx.TimeoutException:
         return ServiceStatus(
             name=name,
             url=url,
             status="unhealthy",
             error="Timeout",
-            checked_at=datetime.utcnow().isoformat(),
+            checked_at=utc_now_iso(),
         )
     except Exception as e:
         return ServiceStatus(
@@ -231,62 +319,59 @@ async def check_service_health(name: str, url: str) -> ServiceStatus:
             url=url,
             status="unknown",
             error=str(e),
-            checked_at=datetime.utcnow().isoformat(),
+            checked_at=utc_now_iso(),
         )
 
 
-async def get_workflow_info() -> tuple[list[WorkflowInfo], list[ScheduledJobInfo]]:
-    """Fetch workflow and scheduler information from workflow-service."""
+async def _fetch_workflows() -> list[WorkflowInfo]:
+    """Fetch the registered workflows from workflow-service."""
     workflows = []
-    scheduled_jobs = []
-
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Get workflows
-            workflows_response = await client.get(
-                "http://workflow-service:8000/api/workflows/list"
-            )
-            if workflows_response.status_code == 200:
-                data = workflows_response.json()
-                for wf in data.get("workflows", []):
-                    workflows.append(WorkflowInfo(
-                        name=wf.get("name", ""),
-                        description=wf.get("description", ""),
-                        trigger_type=wf.get("trigger_type", ""),
-                        cron_expression=wf.get("cron_expression"),
-                        enabled=wf.get("enabled", False),
-                    ))
-
-            # Get scheduler status
-            scheduler_response = await client.get(
-                "http://workflow-service:8000/api/workflows/scheduler"
-            )
-            if scheduler_response.status_code == 200:
-                data = scheduler_response.json()
-                for job in data.get("jobs", []):
-                    scheduled_jobs.append(ScheduledJobInfo(
-                        id=job.get("id", ""),
-                        name=job.get("name", ""),
-                        next_run=job.get("next_run"),
-                    ))
-
+        client = await get_client()
+        response = await client.get(f"{settings.workflow_service_url}/api/workflows/list")
+        if response.status_code == 200:
+            data = response.json()
+            for wf in data.get("workflows", []):
+                workflows.append(WorkflowInfo(
+                    name=wf.get("name", ""),
+                    description=wf.get("description", ""),
+                    trigger_type=wf.get("trigger_type", ""),
+                    cron_expression=wf.get("cron_expression"),
+                    enabled=wf.get("enabled", False),
+                ))
     except Exception as e:
-        logger.error(f"Failed to fetch workflow info: {e}")
+        logger.error(f"Failed to fetch workflows: {e}")
+    return workflows
 
-    return workflows, scheduled_jobs
+
+async def _fetch_scheduler() -> list[ScheduledJobInfo]:
+    """Fetch the scheduled jobs from workflow-service."""
+    scheduled_jobs = []
+    try:
+        client = await get_client()
+        response = await client.get(f"{settings.workflow_service_url}/api/workflows/scheduler")
+        if response.status_code == 200:
+            data = response.json()
+            for job in data.get("jobs", []):
+                scheduled_jobs.append(ScheduledJobInfo(
+                    id=job.get("id", ""),
+                    name=job.get("name", ""),
+                    next_run=job.get("next_run"),
+                ))
+    except Exception as e:
+        logger.error(f"Failed to fetch scheduler status: {e}")
+    return scheduled_jobs
 
 
 async def get_all_service_statuses() -> DashboardData:
     """Check all services concurrently and fetch workflow info."""
-    # Check service health
-    health_tasks = [
-        check_service_health(name, url)
-        for name, url in settings.services.items()
-    ]
-
-    # Fetch workflow info
-    statuses = await asyncio.gather(*health_tasks)
-    workflows, scheduled_jobs = await get_workflow_info()
+    # Health checks, workflows and scheduler all go out in one round; each
+    # coroutine handles its own errors so one outage can't blank the page
+    *statuses, workflows, scheduled_jobs = await asyncio.gather(
+        *(check_service_health(name, url) for name, url in settings.services.items()),
+        _fetch_workflows(),
+        _fetch_scheduler(),
+    )
 
     healthy_count = sum(1 for s in statuses if s.status == "healthy")
 
@@ -294,507 +379,89 @@ async def get_all_service_statuses() -> DashboardData:
         services=list(statuses),
         workflows=workflows,
         scheduled_jobs=scheduled_jobs,
-        checked_at=datetime.utcnow().isoformat(),
+        checked_at=utc_now_iso(),
         healthy_count=healthy_count,
         total_count=len(statuses),
     )
 
 
-def generate_dashboard_html(data: DashboardData) -> str:
-    """Generate the dashboard HTML."""
-    # Format timestamp
-    checked_at = datetime.fromisoformat(data.checked_at).strftime("%Y-%m-%d %H:%M:%S UTC")
-
-    # Generate service cards
-    service_cards = []
-    for service in data.services:
-        details = []
-        if service.response_time_ms is not None:
-            details.append(f'<p class="response-time">Response: {service.response_time_ms}ms</p>')
-        if service.error:
-            details.append(f'<p class="error-message">Error: {service.error}</p>')
-
-        details_html = "\n".join(details) if details else "<p>No additional info</p>"
-
-        card = f'''
-        <div class="service-card">
-            <div class="service-header">
-                <span class="service-name">{service.name}</span>
-                <span class="status-badge {service.status}">{service.status}</span>
-            </div>
-            <div class="service-details">
-                {details_html}
-            </div>
-        </div>
-        '''
-        service_cards.append(card)
-
-    service_cards_html = "\n".join(service_cards)
-
-    # Generate workflow rows
-    workflow_rows = []
-    for wf in data.workflows:
-        status_class = "enabled" if wf.enabled else "disabled"
-        status_text = "Enabled" if wf.enabled else "Disabled"
-        cron = wf.cron_expression or "-"
-
-        # Find next run time for this workflow
-        next_run = "-"
-        for job in data.scheduled_jobs:
-            if job.id == wf.name:
-                if job.next_run:
-                    try:
-                        next_dt = datetime.fromisoformat(job.next_run.replace("Z", "+00:00"))
-                        next_run = next_dt.strftime("%Y-%m-%d %H:%M:%S")
-                    except:
-                        next_run = job.next_run
-                break
-
-        row = f'''
-        <tr>
-            <td class="workflow-name">{wf.name}</td>
-            <td>{wf.description}</td>
-            <td><span class="trigger-badge">{wf.trigger_type}</span></td>
-            <td class="cron">{cron}</td>
-            <td class="next-run">{next_run}</td>
-            <td><span class="status-badge {status_class}">{status_text}</span></td>
-            <td>
-                <button class="run-btn" onclick="runWorkflow('{wf.name}')">Run Now</button>
-            </td>
-        </tr>
-        '''
-        workflow_rows.append(row)
-
-    workflow_rows_html = "\n".join(workflow_rows) if workflow_rows else '<tr><td colspan="7">No workflows registered</td></tr>'
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="refresh" content="30">
-    <title>Service Dashboard - JWhite Zaps</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            min-height: 100vh;
-            color: #e4e4e4;
-            padding: 20px;
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-
-        header {{
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-
-        h1 {{
-            font-size: 2rem;
-            margin-bottom: 10px;
-            color: #fff;
-        }}
-
-        h2 {{
-            font-size: 1.5rem;
-            margin: 30px 0 20px 0;
-            color: #fff;
-            border-bottom: 1px solid rgba(255,255,255,0.2);
-            padding-bottom: 10px;
-        }}
-
-        .summary {{
-            display: flex;
-            justify-content: center;
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-
-        .summary-card {{
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            padding: 20px 40px;
-            text-align: center;
-            backdrop-filter: blur(10px);
-        }}
-
-        .summary-card.healthy {{
-            border: 2px solid #4ade80;
-        }}
-
-        .summary-card.total {{
-            border: 2px solid #60a5fa;
-        }}
-
-        .summary-number {{
-            font-size: 3rem;
-            font-weight: bold;
-        }}
-
-        .summary-card.healthy .summary-number {{
-            color: #4ade80;
-        }}
-
-        .summary-card.total .summary-number {{
-            color: #60a5fa;
-        }}
-
-        .summary-label {{
-            font-size: 0.9rem;
-            color: #a0a0a0;
-            margin-top: 5px;
-        }}
-
-        .services-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 20px;
-        }}
-
-        .service-card {{
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 12px;
-            padding: 20px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-
-        .service-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.3);
-        }}
-
-        .service-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-
-        .service-name {{
-            font-weight: 600;
-            font-size: 1.1rem;
-        }}
-
-        .status-badge {{
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-
-        .status-badge.healthy, .status-badge.enabled {{
-            background: rgba(74, 222, 128, 0.2);
-            color: #4ade80;
-        }}
-
-        .status-badge.unhealthy, .status-badge.disabled {{
-            background: rgba(248, 113, 113, 0.2);
-            color: #f87171;
-        }}
-
-        .status-badge.unknown {{
-            background: rgba(251, 191, 36, 0.2);
-            color: #fbbf24;
-        }}
-
-        .trigger-badge {{
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            background: rgba(96, 165, 250, 0.2);
-            color: #60a5fa;
-        }}
-
-        .service-details {{
-            font-size: 0.85rem;
-            color: #a0a0a0;
-        }}
-
-        .service-details p {{
-            margin: 5px 0;
-        }}
-
-        .response-time {{
-            color: #60a5fa;
-        }}
-
-        .error-message {{
-            color: #f87171;
-            font-style: italic;
-        }}
-
-        /* Workflow table */
-        .workflow-table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 12px;
-            overflow: hidden;
-        }}
-
-        .workflow-table th, .workflow-table td {{
-            padding: 12px 16px;
-            text-align: left;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-
-        .workflow-table th {{
-            background: rgba(255, 255, 255, 0.1);
-            font-weight: 600;
-            color: #fff;
-        }}
-
-        .workflow-table tr:hover {{
-            background: rgba(255, 255, 255, 0.05);
-        }}
-
-        .workflow-name {{
-            font-weight: 600;
-            color: #60a5fa;
-        }}
-
-        .cron {{
-            font-family: monospace;
-            color: #a0a0a0;
-        }}
-
-        .next-run {{
-            color: #4ade80;
-            font-size: 0.9rem;
-        }}
-
-        .run-btn {{
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #60a5fa;
-            color: #fff;
-            font-size: 0.85rem;
-            cursor: pointer;
-            transition: background 0.2s;
-        }}
-
-        .run-btn:hover {{
-            background: #3b82f6;
-        }}
-
-        .run-btn:disabled {{
-            background: #666;
-            cursor: not-allowed;
-        }}
-
-        /* Result toast */
-        .toast {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            padding: 16px 24px;
-            border-radius: 8px;
-            color: #fff;
-            font-weight: 500;
-            z-index: 1000;
-            display: none;
-        }}
-
-        .toast.success {{
-            background: #4ade80;
-        }}
-
-        .toast.error {{
-            background: #f87171;
-        }}
-
-        .toast.show {{
-            display: block;
-            animation: slideIn 0.3s ease;
-        }}
-
-        @keyframes slideIn {{
-            from {{
-                transform: translateX(100%);
-                opacity: 0;
-            }}
-            to {{
-                transform: translateX(0);
-                opacity: 1;
-            }}
-        }}
-
-        footer {{
-            text-align: center;
-            margin-top: 40px;
-            color: #666;
-            font-size: 0.85rem;
-        }}
-
-        .refresh-note {{
-            margin-top: 10px;
-            font-size: 0.8rem;
-            color: #666;
-        }}
-
-        /* Desktop app download section */
-        .download-section {{
-            margin-top: 30px;
-            padding: 20px;
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 12px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-
-        .download-section h2 {{
-            margin-top: 0;
-            border-bottom: none;
-            padding-bottom: 0;
-        }}
-
-        .download-btn {{
-            display: inline-flex;
-            align-items: center;
-            gap: 10px;
-            padding: 12px 24px;
-            border: none;
-            border-radius: 8px;
-            background: linear-gradient(135deg, #4ade80 0%, #22c55e 100%);
-            color: #fff;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: transform 0.2s, box-shadow 0.2s;
-            text-decoration: none;
-        }}
-
-        .download-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 15px rgba(74, 222, 128, 0.4);
-        }}
-
-        .download-info {{
-            margin-top: 15px;
-            font-size: 0.9rem;
-            color: #a0a0a0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>JWhite Zaps - Service Dashboard</h1>
-            <p>Last checked: {checked_at}</p>
-        </header>
-
-        <div class="summary">
-            <div class="summary-card healthy">
-                <div class="summary-number">{data.healthy_count}</div>
-                <div class="summary-label">Healthy</div>
-            </div>
-            <div class="summary-card total">
-                <div class="summary-number">{data.total_count}</div>
-                <div class="summary-label">Total Services</div>
-            </div>
-        </div>
-
-        <h2>Services</h2>
-        <div class="services-grid">
-            {service_cards_html}
-        </div>
-
-        <h2>Workflows</h2>
-        <table class="workflow-table">
-            <thead>
-                <tr>
-                    <th>Name</th>
-                    <th>Description</th>
-                    <th>Trigger</th>
-                    <th>Schedule</th>
-                    <th>Next Run</th>
-                    <th>Status</th>
-                    <th>Actions</th>
-                </tr>
-            </thead>
-            <tbody>
-                {workflow_rows_html}
-            </tbody>
-        </table>
-
-        <div class="download-section">
-            <h2>Desktop Status Monitor</h2>
-            <p style="margin-bottom: 15px; color: #e4e4e4;">
-                Download the Windows desktop app to see employee clock status in real-time.
-            </p>
-            <a href="/api/dashboard/download/desktop-app" class="download-btn">
-                <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                    <path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"></path>
-                    <polyline points="7,10 12,15 17,10"></polyline>
-                    <line x1="12" y1="15" x2="12" y2="3"></line>
-                </svg>
-                Download for Windows
-            </a>
-            <div class="download-info">
-                <p>Requires Windows 10 or later. The app displays as a small floating window and runs in the system tray.</p>
-            </div>
-        </div>
-
-        <footer>
-            <p class="refresh-note">Auto-refreshes every 30 seconds</p>
-        </footer>
-    </div>
-
-    <div id="toast" class="toast"></div>
-
-    <script>
-        async function runWorkflow(name) {{
-            const btn = event.target;
-            btn.disabled = true;
-            btn.textContent = 'Running...';
-
-            try {{
-                const response = await fetch('/api/workflows/run/' + name, {{
-                    method: 'POST'
-                }});
-                const result = await response.json();
-
-                if (result.status === 'success') {{
-                    showToast('Workflow completed successfully!', 'success');
-                }} else {{
-                    showToast('Workflow failed: ' + (result.error || 'Unknown error'), 'error');
-                }}
-            }} catch (err) {{
-                showToast('Request failed: ' + err.message, 'error');
-            }} finally {{
-                btn.disabled = false;
-                btn.textContent = 'Run Now';
-            }}
-        }}
-
-        function showToast(message, type) {{
-            const toast = document.getElementById('toast');
-            toast.textContent = message;
-            toast.className = 'toast ' + type + ' show';
-
-            setTimeout(() => {{
-                toast.classList.remove('show');
-            }}, 5000);
-        }}
-    </script>
-</body>
-</html>'''
-
-    return html
+# Every open dashboard tab refreshes every 30s; share one sweep across them
+DASHBOARD_CACHE_TTL = 5.0
+_dashboard_cache = {"at": float("-inf"), "entry": None}
+_dashboard_lock = asyncio.Lock()
+
+
+async def get_dashboard_data(fresh: bool = False) -> tuple[DashboardData, bytes, str]:
+    """
+    Dashboard data, cached for DASHBOARD_CACHE_TTL seconds.
+
+    Concurrent callers on a cold cache wait for a single refresh.
+    Returns (data, serialized JSON body, ETag).
+    """
+    if not fresh and time.monotonic() - _dashboard_cache["at"] < DASHBOARD_CACHE_TTL:
+        return _dashboard_cache["entry"]
+
+    async with _dashboard_lock:
+        # Another caller may have refreshed while we waited
+        if not fresh and time.monotonic() - _dashboard_cache["at"] < DASHBOARD_CACHE_TTL:
+            return _dashboard_cache["entry"]
+
+        data = await get_all_service_statuses()
+        body = orjson.dumps(data.model_dump(mode="json"))
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        _dashboard_cache["entry"] = (data, body, etag)
+        _dashboard_cache["at"] = time.monotonic()
+    return _dashboard_cache["entry"]
+
+
+@lru_cache(maxsize=256)
+def _format_next_run(next_run: str) -> str:
+    """Display string for a scheduler next_run timestamp (same value across refreshes)."""
+    try:
+        next_dt = datetime.fromisoformat(next_run.replace("Z", "+00:00"))
+        return next_dt.strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return next_run
+
+
+def _format_next_runs(scheduled_jobs: list[ScheduledJobInfo]) -> dict[str, str]:
+    """Map job ID (= workflow name) to a display string for its next run."""
+    next_runs = {}
+    for job in scheduled_jobs:
+        if job.id not in next_runs and job.next_run:
+            next_runs[job.id] = _format_next_run(job.next_run)
+    return next_runs
+
+
+# Last rendered page and the DashboardData it was rendered from
+_rendered_dashboard = {"data": None, "html": "", "gzip": None}
+
+
+def render_dashboard(data: DashboardData) -> str:
+    """
+    Render the dashboard HTML page from the template.
+
+    The page depends only on `data`, so tabs served from the same cached
+    sweep share one render.
+    """
+    if _rendered_dashboard["data"] is not data:
+        _rendered_dashboard["html"] = templates.get_template("dashboard.html").render(
+            data=data,
+            checked_at=datetime.fromisoformat(data.checked_at).strftime("%Y-%m-%d %H:%M:%S UTC"),
+            next_runs=_format_next_runs(data.scheduled_jobs),
+            static_version=STATIC_VERSION,
+        )
+        _rendered_dashboard["gzip"] = None
+        _rendered_dashboard["data"] = data
+    return _rendered_dashboard["html"]
+
+
+def render_dashboard_gzip(data: DashboardData) -> bytes:
+    """Gzip-compressed dashboard page, compressed once per render."""
+    html = render_dashboard(data)
+    if _rendered_dashboard["gzip"] is None:
+        _rendered_dashboard["gzip"] = gzip.compress(html.encode(), compresslevel=6)
+    return _rendered_dashboard["gzip"]
 
 
 @app.get("/api/dashboard/health")
@@ -803,24 +470,38 @@ async def health_check():
     return {"status": "healthy", "service": "dashboard-service"}
 
 
-@app.get("/api/dashboard/status", response_model=DashboardData)
-async def get_status():
-    """Get raw status data as JSON."""
-    return await get_all_service_statuses()
+@app.get("/api/dashboard/status", responses={200: {"model": DashboardData}})
+async def get_status(request: Request, fresh: bool = False):
+    """
+    Get raw status data as JSON.
+
+    - **fresh**: Bypass the short-lived cache and check every service now
+    """
+    _, body, etag = await get_dashboard_data(fresh)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    # Pre-serialized from our own models - no re-validation or jsonable_encoder
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/dashboard", response_class=HTMLResponse)
-async def dashboard():
+async def dashboard(request: Request, fresh: bool = False):
     """Render the dashboard HTML page."""
-    data = await get_all_service_statuses()
-    html = generate_dashboard_html(data)
-    return HTMLResponse(content=html)
+    data, _, _ = await get_dashboard_data(fresh)
+    # Compressed once per render; the gzip middleware leaves this route alone
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        return HTMLResponse(
+            render_dashboard_gzip(data),
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return HTMLResponse(render_dashboard(data), headers={"Vary": "Accept-Encoding"})
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request, fresh: bool = False):
     """Redirect root to dashboard."""
-    return await dashboard()
+    return await dashboard(request, fresh)
 
 
 # =============================================================================
@@ -876,7 +557,7 @@ async def employee_status_websocket(
             data = await websocket.receive_text()
             # Could handle client commands here if needed (e.g., ping/pong)
             if data == "ping":
-                await websocket.send_text('{"type": "pong"}')
+                await status_manager.send_pong(websocket)
 
     except WebSocketDisconnect:
         logger.info(f"Client {client_id} disconnected")
@@ -886,11 +567,11 @@ async def employee_status_websocket(
         await status_manager.unregister_connection(websocket)
 
 
-@app.get("/api/dashboard/employee-status")
+@app.get("/api/dashboard/employee-status", responses={200: {"model": EmployeeStatusResponse}})
 async def get_employee_statuses(
     x_api_key: str = Header(None, alias="X-API-Key"),
     api_key: str = Query(None),
-) -> EmployeeStatusResponse:
+):
     """
     Get all employee clock statuses (REST endpoint).
 
@@ -903,18 +584,43 @@ async def get_employee_statuses(
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
     statuses = await status_manager.get_all_statuses()
-    return EmployeeStatusResponse(
-        employees=statuses,
-        connected_clients=status_manager.connection_count,
-    )
+    # Stored rows are already EmployeeStatus-shaped - no model round-trip
+    return ORJSONResponse({
+        "employees": statuses,
+        "connected_clients": status_manager.connection_count,
+    })
+
+
+# Declared before /{employee_id} so "info" isn't captured as an employee ID
+@app.get("/api/dashboard/employee-status/info")
+async def employee_status_info():
+    """
+    Public info endpoint showing how to connect to the employee status API.
+
+    No authentication required - just provides connection information.
+    """
+    return {
+        "websocket_url": "/api/dashboard/employee-status/ws?api_key=YOUR_API_KEY",
+        "rest_url": "/api/dashboard/employee-status",
+        "authentication": {
+            "websocket": "Pass api_key as query parameter",
+            "rest": "Pass X-API-Key header or api_key query parameter",
+        },
+        "connected_clients": status_manager.connection_count,
+        "deduplicated_updates": status_manager.deduped_update_count,
+        "message_types": {
+            "all_statuses": "Sent on connection with all current employee statuses",
+            "status_update": "Sent when an employee's status changes",
+        },
+    }
 
 
-@app.get("/api/dashboard/employee-status/{employee_id}")
+@app.get("/api/dashboard/employee-status/{employee_id}", responses={200: {"model": EmployeeStatus}})
 async def get_employee_status(
     employee_id: str,
     x_api_key: str = Header(None, alias="X-API-Key"),
     api_key: str = Query(None),
-) -> EmployeeStatus:
+):
     """Get status for a specific employee."""
     key = x_api_key or api_key
     if not key or not status_manager.validate_api_key(key):
@@ -923,7 +629,7 @@ async def get_employee_status(
     status = await status_manager.get_status(employee_id)
     if not status:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return status
+    return ORJSONResponse(status)
 
 
 # =============================================================================
@@ -980,28 +686,6 @@ async def update_employee_status(
     }
 
 
-@app.get("/api/dashboard/employee-status/info")
-async def employee_status_info():
-    """
-    Public info endpoint showing how to connect to the employee status API.
-
-    No authentication required - just provides connection information.
-    """
-    return {
-        "websocket_url": "/api/dashboard/employee-status/ws?api_key=YOUR_API_KEY",
-        "rest_url": "/api/dashboard/employee-status",
-        "authentication": {
-            "websocket": "Pass api_key as query parameter",
-            "rest": "Pass X-API-Key header or api_key query parameter",
-        },
-        "connected_clients": status_manager.connection_count,
-        "message_types": {
-            "all_statuses": "Sent on connection with all current employee statuses",
-            "status_update": "Sent when an employee's status changes",
-        },
-    }
-
-
 # =============================================================================
 # DESKTOP APP DOWNLOAD
 # =============================================================================
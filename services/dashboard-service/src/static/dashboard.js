@@ -0,0 +1,33 @@
+async function runWorkflow(name) {
+    const btn = event.target;
+    btn.disabled = true;
+    btn.textContent = 'Running...';
+
+    try {
+        const response = await fetch('/api/workflows/run/' + encodeURIComponent(name), {
+            method: 'POST'
+        });
+        const result = await response.json();
+
+        if (result.status === 'success') {
+            showToast('Workflow completed successfully!', 'success');
+        } else {
+            showToast('Workflow failed: ' + (result.error || 'Unknown error'), 'error');
+        }
+    } catch (err) {
+        showToast('Request failed: ' + err.message, 'error');
+    } finally {
+        btn.disabled = false;
+        btn.textContent = 'Run Now';
+    }
+}
+
+function showToast(message, type) {
+    const toast = document.getElementById('toast');
+    toast.textContent = message;
+    toast.className = 'toast ' + type + ' show';
+
+    setTimeout(() => {
+        toast.classList.remove('show');
+    }, 5000);
+}
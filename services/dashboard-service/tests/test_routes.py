@@ -0,0 +1,30 @@
+"""Route-level checks for the dashboard service.
+
+Run from services/dashboard-service: python -m pytest tests
+"""
+
+from fastapi.testclient import TestClient
+
+from src.main import accepts_gzip, app
+
+# Not entered as a context manager, so the lifespan (Deputy recovery) doesn't run
+client = TestClient(app)
+
+
+def test_employee_status_info_is_not_shadowed_by_employee_id_route():
+    response = client.get("/api/dashboard/employee-status/info")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert "deduplicated_updates" in body
+    assert body["rest_url"] == "/api/dashboard/employee-status"
+
+
+def test_accepts_gzip_honours_q_values():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("deflate, gzip;q=0.5")
+    assert accepts_gzip("*")
+    assert not accepts_gzip("")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("*, gzip;q=0")
+    assert not accepts_gzip("identity")